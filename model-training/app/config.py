@@ -1,7 +1,7 @@
 """Configuration for the model training service."""
 
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -27,6 +27,8 @@ class TrainingConfig(BaseSettings):
     TRAINING_WEIGHT_DECAY: float = float(os.getenv("TRAINING_WEIGHT_DECAY", "0.01"))
     TRAINING_GRADIENT_ACCUMULATION_STEPS: int = int(os.getenv("TRAINING_GRADIENT_ACCUMULATION_STEPS", "4"))
     TRAINING_MAX_GRAD_NORM: float = float(os.getenv("TRAINING_MAX_GRAD_NORM", "1.0"))
+    TRAINING_DATASET_CACHE_DIR: str = os.getenv("TRAINING_DATASET_CACHE_DIR", "/app/data/cache/tokenized")
+    TRAINING_TORCH_COMPILE: bool = os.getenv("TRAINING_TORCH_COMPILE", "false").lower() == "true"
 
     # Model Configuration
     LLM_MODEL_STANDARD: str = os.getenv("LLM_MODEL_STANDARD", "meta-llama/Llama-3.1-8B-Instruct-AWQ")
@@ -68,13 +70,18 @@ class TrainingConfig(BaseSettings):
 
     # Job Configuration
     MAX_CONCURRENT_TRAINING_JOBS: int = int(os.getenv("MAX_CONCURRENT_TRAINING_JOBS", "1"))
+    TRAINING_QUEUE_MAX_SIZE: int = int(os.getenv("TRAINING_QUEUE_MAX_SIZE", "4"))  # Jobs waiting for a worker
     JOB_TIMEOUT_SECONDS: int = int(os.getenv("JOB_TIMEOUT_SECONDS", "86400"))  # 24 hours
     JOB_POLL_INTERVAL_SECONDS: int = int(os.getenv("JOB_POLL_INTERVAL_SECONDS", "5"))
+    JOB_STATE_TTL_SECONDS: int = int(os.getenv("JOB_STATE_TTL_SECONDS", "604800"))  # 7 days
 
     # Evaluation Configuration
     EVAL_METRICS: list = ["exact_match", "f1", "bleu", "ndcg", "hallucination_rate", "llm_judge_score"]
     HALLUCINATION_THRESHOLD: float = float(os.getenv("HALLUCINATION_THRESHOLD", "0.15"))
     EVALUATION_MODEL: str = os.getenv("EVALUATION_MODEL", "meta-llama/Llama-3.1-8B-Instruct-AWQ")
+    # Per-criterion linear correction [a, b] applied to judge scores as a*x + b,
+    # e.g. {"relevance": [1.05, -0.1]} when calibrating a smaller judge model
+    EVALUATION_JUDGE_CALIBRATION: Dict[str, List[float]] = {}
 
     # LLM Service Configuration
     LLM_SERVICE_URL: str = os.getenv("LLM_SERVICE_URL", "http://llm-service:8002")
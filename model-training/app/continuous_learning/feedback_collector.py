@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from app.utils.jsonl import write_jsonl
 from app.utils.logging_config import setup_json_logging
 
 
@@ -260,9 +261,7 @@ class FeedbackCollector:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for example in retraining_examples:
-                f.write(json.dumps(example, ensure_ascii=False) + "\n")
+        write_jsonl(output_path, retraining_examples)
 
         logger.info(
             "Generated retraining dataset from feedback",
@@ -316,9 +315,7 @@ class FeedbackCollector:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for qa in qa_pairs:
-                f.write(json.dumps(qa, ensure_ascii=False) + "\n")
+        write_jsonl(output_path, qa_pairs)
 
         logger.info(
             "Exported feedback as QA pairs",
@@ -1,6 +1,5 @@
 """Comprehensive benchmark suite for model evaluation."""
 
-import json
 import asyncio
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -8,7 +7,8 @@ from datetime import datetime
 
 from app.evaluation.hindi_qa_eval import HindiQAEvaluator
 from app.evaluation.hallucination_detector import HallucinationDetector
-from app.evaluation.response_quality import ResponseQualityEvaluator
+from app.evaluation.response_quality import ResponseQualityEvaluator, close_http_client
+from app.utils.jsonl import iter_jsonl
 from app.utils.logging_config import setup_json_logging
 
 
@@ -29,6 +29,7 @@ class BenchmarkSuite:
         eval_dataset_path: str,
         predictions: List[str],
         sources: Optional[List[List[str]]] = None,
+        eval_data: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Run complete evaluation benchmark.
 
@@ -36,6 +37,7 @@ class BenchmarkSuite:
             eval_dataset_path: Path to evaluation dataset
             predictions: List of model predictions
             sources: Optional list of source documents
+            eval_data: Already-loaded dataset records (skips reading the file)
 
         Returns:
             Complete benchmark results
@@ -46,7 +48,8 @@ class BenchmarkSuite:
         )
 
         # Load evaluation dataset
-        eval_data = self._load_eval_dataset(eval_dataset_path)
+        if eval_data is None:
+            eval_data = self._load_eval_dataset(eval_dataset_path)
 
         if not eval_data or len(eval_data) != len(predictions):
             logger.error(
@@ -94,9 +97,7 @@ class BenchmarkSuite:
         # Run response quality evaluation
         logger.info("Running response quality evaluation")
         quality_metrics = asyncio.run(
-            self.quality_evaluator.evaluate_batch_quality(
-                questions, predictions, references
-            )
+            self._evaluate_quality_in_new_loop(questions, predictions, references)
         )
         results["metrics"]["quality_metrics"] = quality_metrics
 
@@ -113,6 +114,32 @@ class BenchmarkSuite:
 
         return results
 
+    async def _evaluate_quality_in_new_loop(
+        self,
+        questions: List[str],
+        responses: List[str],
+        references: List[str],
+    ) -> Dict[str, float]:
+        """Run batch quality evaluation on a loop started by asyncio.run.
+
+        The judge HTTP client created on this loop is closed before the loop
+        ends, so its connections are not leaked.
+
+        Args:
+            questions: List of questions
+            responses: List of responses
+            references: List of reference answers
+
+        Returns:
+            Aggregate quality metrics
+        """
+        try:
+            return await self.quality_evaluator.evaluate_batch_quality(
+                questions, responses, references
+            )
+        finally:
+            await close_http_client()
+
     def run_qa_benchmark(
         self,
         predictions: List[str],
@@ -202,14 +229,8 @@ class BenchmarkSuite:
 
         # Add per-response analysis
         per_response_quality = []
-        for q, p in zip(questions, predictions):
-            length_metrics = self.quality_evaluator.evaluate_response_length(p)
-            language_metrics = self.quality_evaluator.evaluate_language_quality(p)
-
-            per_response_quality.append({
-                "length": length_metrics,
-                "language": language_metrics,
-            })
+        for p in predictions:
+            per_response_quality.append(self.quality_evaluator.evaluate_text_quality(p))
 
         overall_metrics["per_response_quality"] = per_response_quality
 
@@ -227,10 +248,7 @@ class BenchmarkSuite:
         data = []
 
         try:
-            with open(dataset_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        data.append(json.loads(line))
+            data.extend(iter_jsonl(dataset_path))
 
             logger.info(
                 "Loaded evaluation dataset",
@@ -1,17 +1,49 @@
 """Detect hallucinated facts in model outputs."""
 
-from typing import Dict, List, Tuple, Optional
+import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
 from app.utils.logging_config import setup_json_logging
 
 
 logger = setup_json_logging("hallucination_detector")
 
+# Batches larger than this are split into one block per worker thread so that
+# executor submission overhead is paid per block rather than per prediction.
+BATCH_CHUNK_THRESHOLD = 1000
+
+
+@lru_cache(maxsize=65536)
+def _extract_facts_cached(text: str) -> Tuple[str, ...]:
+    """Extract facts from text (memoized).
+
+    Args:
+        text: Input text
+
+    Returns:
+        Tuple of extracted facts (simple extraction)
+    """
+    facts = []
+
+    # Extract sentences as basic facts
+    sentences = re.split(r"[.!?]+", text)
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if len(sentence.split()) >= 3:  # At least 3 words
+            facts.append(sentence)
+
+    return tuple(facts)
+
 
 class HallucinationDetector:
     """Detect hallucinations in model responses."""
 
+    __slots__ = ("patterns",)
+
     def __init__(self):
         """Initialize detector."""
         self.patterns = {
@@ -44,11 +76,12 @@ class HallucinationDetector:
         # Check each fact against sources
         supported_facts = 0
         total_facts = len(facts)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for fact in facts:
             if self._fact_supported(fact, source_text):
                 supported_facts += 1
-            else:
+            elif debug_enabled:
                 logger.debug(
                     "Unsupported fact detected",
                     extra={"fact": fact},
@@ -76,16 +109,7 @@ class HallucinationDetector:
         Returns:
             List of extracted facts (simple extraction)
         """
-        facts = []
-
-        # Extract sentences as basic facts
-        sentences = re.split(r"[.!?]+", text)
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence.split()) >= 3:  # At least 3 words
-                facts.append(sentence)
-
-        return facts
+        return list(_extract_facts_cached(text))
 
     def _fact_supported(self, fact: str, source_text: str) -> bool:
         """Check if fact is supported by source text.
@@ -245,21 +269,35 @@ class HallucinationDetector:
         self,
         predictions: List[str],
         sources: List[List[str]],
+        max_workers: Optional[int] = None,
     ) -> Dict[str, float]:
         """Evaluate hallucinations in a batch.
 
+        Predictions are independent of each other, so they are scored
+        concurrently on a thread pool.
+
         Args:
             predictions: List of predictions
             sources: List of source documents per prediction
+            max_workers: Worker thread count (defaults to CPU count)
 
         Returns:
             Aggregated metrics
         """
-        all_hallucination_rates = []
+        pairs = list(zip(predictions, sources))
+        workers = max_workers or os.cpu_count() or 1
+
+        if len(pairs) > BATCH_CHUNK_THRESHOLD:
+            chunk_size = -(-len(pairs) // workers)
+        else:
+            chunk_size = 1
+        chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
 
-        for pred, source_docs in zip(predictions, sources):
-            result = self.detect_hallucinations(pred, source_docs)
-            all_hallucination_rates.append(result["hallucination_rate"])
+        all_hallucination_rates = []
+        if chunks:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for chunk_rates in executor.map(self._chunk_hallucination_rates, chunks):
+                    all_hallucination_rates.extend(chunk_rates)
 
         avg_hallucination_rate = (
             sum(all_hallucination_rates) / len(all_hallucination_rates)
@@ -273,3 +311,20 @@ class HallucinationDetector:
             "min_hallucination_rate": min(all_hallucination_rates) if all_hallucination_rates else 0.0,
             "sample_count": len(predictions),
         }
+
+    def _chunk_hallucination_rates(
+        self,
+        chunk: List[Tuple[str, List[str]]],
+    ) -> List[float]:
+        """Compute hallucination rates for a block of predictions.
+
+        Args:
+            chunk: List of (prediction, source documents) pairs
+
+        Returns:
+            Hallucination rate per prediction, in input order
+        """
+        return [
+            self.detect_hallucinations(pred, source_docs)["hallucination_rate"]
+            for pred, source_docs in chunk
+        ]
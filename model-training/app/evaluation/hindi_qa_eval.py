@@ -1,27 +1,59 @@
 """Hindi QA evaluation metrics."""
 
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from collections import Counter
 
-import nltk
-from nltk.translate.bleu_score import sentence_bleu, corpus_bleu
-
 from app.utils.logging_config import setup_json_logging
 
 
 logger = setup_json_logging("hindi_qa_eval")
 
-# Download required NLTK data
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt", quiet=True)
+# Devanagari Unicode range: U+0900 to U+097F
+_DEVANAGARI_RE = re.compile(r"[\u0900-\u097f]")
+
+# Anything that is neither a word character nor whitespace
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=65536)
+def _normalize_cached(text: str) -> str:
+    """Normalize text for comparison (memoized).
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text
+    """
+    # Lowercase and strip punctuation first so the whitespace collapse runs
+    # over the shortest intermediate string (and absorbs gaps left behind by
+    # removed punctuation).
+    text = _PUNCT_RE.sub("", text.lower())
+
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=65536)
+def _tokenize_cached(text: str) -> Tuple[str, ...]:
+    """Tokenize text (memoized, works with Hindi and English).
+
+    Args:
+        text: Input text
+
+    Returns:
+        Tuple of tokens
+    """
+    # Simple whitespace tokenization (handles both Hindi and English)
+    return tuple(text.split())
 
 
 class HindiQAEvaluator:
     """Evaluate QA performance with Hindi-specific metrics."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize evaluator."""
         pass
@@ -51,15 +83,27 @@ class HindiQAEvaluator:
         Returns:
             F1 score (0.0-1.0)
         """
-        pred_tokens = self._tokenize(prediction)
-        ref_tokens = self._tokenize(reference)
-
-        common_tokens = Counter(pred_tokens) & Counter(ref_tokens)
-        num_common = sum(common_tokens.values())
+        pred_tokens = _tokenize_cached(prediction)
+        ref_tokens = _tokenize_cached(reference)
 
         if len(pred_tokens) == 0 or len(ref_tokens) == 0:
             return int(pred_tokens == ref_tokens)
 
+        # Count the shorter side once, then consume matches from the longer
+        # side: one hash table instead of two Counters plus an intersection.
+        if len(pred_tokens) <= len(ref_tokens):
+            small, large = pred_tokens, ref_tokens
+        else:
+            small, large = ref_tokens, pred_tokens
+
+        remaining = Counter(small)
+        num_common = 0
+        for token in large:
+            count = remaining.get(token, 0)
+            if count:
+                num_common += 1
+                remaining[token] = count - 1
+
         if num_common == 0:
             return 0.0
 
@@ -90,6 +134,9 @@ class HindiQAEvaluator:
         # Use weights appropriate for short sequences
         weights = (0.5, 0.5) if len(pred_tokens) < 10 else (0.25, 0.25, 0.25, 0.25)
 
+        # Imported lazily: NLTK is only needed for BLEU and is slow to load
+        from nltk.translate.bleu_score import sentence_bleu
+
         try:
             bleu = sentence_bleu(reference_tokens, pred_tokens, weights=weights)
             return bleu
@@ -149,16 +196,7 @@ class HindiQAEvaluator:
         Returns:
             Normalized text
         """
-        # Remove extra whitespace
-        text = " ".join(text.split())
-
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove punctuation (but keep spaces)
-        text = re.sub(r"[^\w\s]", "", text)
-
-        return text
+        return _normalize_cached(text)
 
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text (works with Hindi and English).
@@ -169,10 +207,7 @@ class HindiQAEvaluator:
         Returns:
             List of tokens
         """
-        # Simple whitespace tokenization (handles both Hindi and English)
-        text = text.strip()
-        tokens = text.split()
-        return tokens
+        return list(_tokenize_cached(text))
 
     def hindi_specific_evaluation(
         self,
@@ -223,11 +258,7 @@ class HindiQAEvaluator:
         Returns:
             True if contains Devanagari, False otherwise
         """
-        # Devanagari Unicode range: U+0900 to U+097F
-        for char in text:
-            if "\u0900" <= char <= "\u097f":
-                return True
-        return False
+        return _DEVANAGARI_RE.search(text) is not None
 
     def token_overlap_ratio(self, prediction: str, reference: str) -> float:
         """Calculate token overlap ratio.
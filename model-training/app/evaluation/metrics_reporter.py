@@ -1,10 +1,11 @@
 """Generate evaluation reports and metrics."""
 
-import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import orjson
+
 from app.utils.logging_config import setup_json_logging
 
 
@@ -14,6 +15,8 @@ logger = setup_json_logging("metrics_reporter")
 class MetricsReporter:
     """Generate and report evaluation metrics."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize metrics reporter."""
         pass
@@ -40,7 +43,7 @@ class MetricsReporter:
             "metrics": metrics,
         }
 
-        json_report = json.dumps(report, indent=2, ensure_ascii=False)
+        json_report = orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8")
 
         if output_file:
             with open(output_file, "w", encoding="utf-8") as f:
@@ -315,25 +318,28 @@ class MetricsReporter:
             "metric_comparison": {},
         }
 
-        # Extract and compare key metrics
-        for metric_key in ["exact_match", "f1", "bleu", "overall_quality"]:
-            comparison["metric_comparison"][metric_key] = {}
-
-            for model_name, metrics in zip(model_names, model_metrics):
-                # Find metric value in nested structure
-                value = self._extract_metric_value(metrics, metric_key)
-                comparison["metric_comparison"][metric_key][model_name] = value
+        # Flatten each model's nested metrics once, then compare key metrics
+        flat_metrics = [self._flatten_metrics(metrics) for metrics in model_metrics]
 
-        # Determine best model for each metric
         comparison["best_model"] = {}
-        for metric_key, values in comparison["metric_comparison"].items():
-            if values:
-                best_model = max(values, key=values.get)
+        for metric_key in ["exact_match", "f1", "bleu", "overall_quality"]:
+            values = {}
+            best_model = None
+            best_value = 0.0
+
+            for model_name, flat in zip(model_names, flat_metrics):
+                value = float(flat.get(metric_key, 0.0))
+                values[model_name] = value
+                if best_model is None or value > best_value:
+                    best_model, best_value = model_name, value
+
+            comparison["metric_comparison"][metric_key] = values
+            if best_model is not None:
                 comparison["best_model"][metric_key] = best_model
 
         if output_file:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(comparison, f, indent=2, ensure_ascii=False)
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(comparison, option=orjson.OPT_INDENT_2))
 
             logger.info(
                 "Model comparison saved",
@@ -342,23 +348,23 @@ class MetricsReporter:
 
         return comparison
 
-    def _extract_metric_value(self, metrics: Dict[str, Any], key: str) -> float:
-        """Extract metric value from nested metrics dict.
+    def _flatten_metrics(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten nested metrics dict into a single key lookup table.
+
+        Top-level scalar values take precedence, followed by sections in
+        the order qa, quality, hallucination, hindi.
 
         Args:
             metrics: Metrics dictionary
-            key: Metric key to extract
 
         Returns:
-            Metric value or 0.0 if not found
+            Flat dictionary of metric values
         """
-        # Try direct access
-        if key in metrics:
-            return float(metrics[key])
+        flat: Dict[str, Any] = {}
+
+        for section in ["hindi_metrics", "hallucination_metrics", "quality_metrics", "qa_metrics"]:
+            flat.update(metrics.get(section) or {})
 
-        # Try nested access
-        for section in ["qa_metrics", "quality_metrics", "hallucination_metrics", "hindi_metrics"]:
-            if section in metrics and key in metrics[section]:
-                return float(metrics[section][key])
+        flat.update({k: v for k, v in metrics.items() if not isinstance(v, dict)})
 
-        return 0.0
+        return flat
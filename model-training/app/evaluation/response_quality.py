@@ -1,25 +1,454 @@
 """LLM-as-judge response quality evaluation."""
 
 import asyncio
-import json
-from typing import Dict, List, Optional
-
+import hashlib
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+import orjson
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.config import get_config
 from app.utils.logging_config import setup_json_logging
 
 
 logger = setup_json_logging("response_quality")
+config = get_config()
+
+# Token budgets per prompt field, bounding prefill cost on outlier inputs
+PROMPT_TOKEN_BUDGETS: Dict[str, int] = {
+    "question": 256,
+    "response": 512,
+    "reference": 512,
+    "context": 1024,
+}
+
+# Approximate words per token, used when the judge tokenizer is unavailable
+_WORDS_PER_TOKEN = 0.75
+
+# Seconds before a failed judge tokenizer load is attempted again
+JUDGE_TOKENIZER_RETRY_SECONDS = 300.0
+
+# Loaded judge tokenizers by model name, and when each failed load happened.
+# Loads run on worker threads; the lock keeps concurrent first calls from
+# loading the same tokenizer twice.
+_judge_tokenizers: Dict[str, Any] = {}
+_judge_tokenizer_failures: Dict[str, float] = {}
+_judge_tokenizer_lock = threading.Lock()
+
+# LLM service responses worth retrying with backoff
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Per-response judge scores, in aggregation order
+QUALITY_METRIC_KEYS = ("relevance", "correctness", "completeness", "clarity", "overall")
+
+# Criteria the judge scores directly; "overall" is derived from them
+JUDGE_CRITERIA = QUALITY_METRIC_KEYS[:4]
+
+# Neutral scores used when the judge is unavailable or its output is unusable
+DEFAULT_SCORES: Dict[str, float] = {key: 2.5 for key in QUALITY_METRIC_KEYS}
+
+# Decode budget for a single judgment: the four-score JSON object is well
+# under 100 tokens, leaving room for the optional one-line reasoning
+JUDGE_MAX_TOKENS = 128
+
+# Decode budget per judged item when several items share one prompt
+BATCH_TOKENS_PER_ITEM = 120
+
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENT_RE = re.compile(r"[.!?]+\s+")
+
+_CRITERIA = """1. Relevance (1-5): How relevant is the response to the question?
+2. Correctness (1-5): Is the information factually correct?
+3. Completeness (1-5): Does it fully address the question?
+4. Clarity (1-5): Is the response clear and well-structured?"""
+
+# Judge instructions are sent as a byte-identical system message on every call
+# and all per-item content goes last, so the LLM server's prefix cache can
+# reuse the KV state of the rubric across judgments.
+JUDGE_SYSTEM_PROMPT = """You are an expert evaluator of response quality.
+
+Evaluate the quality of the response in the user message on a scale of 1-5 for each criterion.
+Use the reference answer and source context, when provided, to judge correctness.
+
+Evaluate on these criteria:
+""" + _CRITERIA + """
+
+Provide scores in JSON format:
+{
+  "relevance": <score 1-5>,
+  "correctness": <score 1-5>,
+  "completeness": <score 1-5>,
+  "clarity": <score 1-5>,
+  "reasoning": "<optional, at most 20 words>"
+}
+Respond with the JSON object only."""
+
+BATCH_JUDGE_SYSTEM_PROMPT = """You are an expert evaluator of response quality.
+
+The user message contains several numbered items. Evaluate the quality of each item's response on a scale of 1-5 for each criterion.
+Use the reference answer, when provided, to judge correctness.
+
+Evaluate each item on these criteria:
+""" + _CRITERIA + """
+
+Provide scores in JSON format, with exactly one entry per item in item order:
+{
+  "results": [
+    {"relevance": <score 1-5>, "correctness": <score 1-5>, "completeness": <score 1-5>, "clarity": <score 1-5>}
+  ]
+}
+Respond with the JSON object only."""
+
+# Connection pools for LLM judge calls, one per event loop: an httpx client
+# is bound to the loop it was first used on, and BenchmarkSuite drives batches
+# via asyncio.run. Whoever owns a loop closes its client with
+# close_http_client before the loop ends.
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop.
+
+    Returns:
+        Pooled async HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None or client.is_closed:
+        # Forget clients of loops that ended; their connections died with them
+        for stale in [owner for owner in _clients if owner.is_closed()]:
+            del _clients[stale]
+
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=httpx.Timeout(30.0),
+        )
+        _clients[loop] = client
+
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's HTTP client, if it has one."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class CircuitOpenError(Exception):
+    """Raised when the LLM judge circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Minimal consecutive-failure circuit breaker.
+
+    Opens after `fail_max` consecutive failures and rejects calls for
+    `reset_timeout` seconds. It then lets one trial call through and rejects
+    the rest until that call records its outcome. A trial that never reports
+    back (e.g. it was cancelled) is given up on after another `reset_timeout`.
+    """
+
+    __slots__ = ("fail_max", "reset_timeout", "_failures", "_opened_at", "_trial_started_at")
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 60.0):
+        """Initialize circuit breaker.
+
+        Args:
+            fail_max: Consecutive failures before opening
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        """Check whether a call may proceed."""
+        if self._opened_at is None:
+            return True
+
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+
+        # Half-open: one trial call at a time
+        if self._trial_started_at is not None and now - self._trial_started_at < self.reset_timeout:
+            return False
+
+        self._trial_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
+            self._trial_started_at = None
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Check whether an LLM service error is worth retrying."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """Extract the first balanced JSON object from free-form judge output.
+
+    Scans once from the first "{", tracking string and escape state so
+    braces inside string values are ignored. Trailing text after the
+    object (which may itself contain braces) is not included.
+
+    Args:
+        text: LLM output
+
+    Returns:
+        JSON object substring, or None if no balanced object is found
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+
+    for i in range(start, len(text)):
+        char = text[i]
+
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
+
+def _validate_judgment(judgment_json: Any) -> Optional[str]:
+    """Check a parsed judgment against the expected score schema.
+
+    Args:
+        judgment_json: Parsed judgment object
+
+    Returns:
+        Description of the first violation, or None if the judgment is valid
+    """
+    if not isinstance(judgment_json, dict):
+        return f"expected object, got {type(judgment_json).__name__}"
+
+    for key in JUDGE_CRITERIA:
+        value = judgment_json.get(key)
+        if value is None:
+            return f"missing {key}"
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return f"{key} is not a number"
+        if not 1 <= value <= 5:
+            return f"{key}={value} outside 1-5"
+
+    return None
+
+
+def _judge_tokenizer_recently_failed(model_name: str) -> bool:
+    """Check whether the last load of a judge tokenizer failed too recently to retry.
+
+    Args:
+        model_name: Judge model name
+
+    Returns:
+        True while the failure is younger than JUDGE_TOKENIZER_RETRY_SECONDS
+    """
+    failed_at = _judge_tokenizer_failures.get(model_name)
+    return failed_at is not None and time.monotonic() - failed_at < JUDGE_TOKENIZER_RETRY_SECONDS
+
+
+def _load_judge_tokenizer(model_name: str) -> Optional[Any]:
+    """Load a judge model tokenizer (worker thread).
+
+    Args:
+        model_name: Judge model name
+
+    Returns:
+        Tokenizer, or None if it cannot be loaded
+    """
+    with _judge_tokenizer_lock:
+        tokenizer = _judge_tokenizers.get(model_name)
+        if tokenizer is not None or _judge_tokenizer_recently_failed(model_name):
+            return tokenizer
+
+        try:
+            from transformers import AutoTokenizer
+
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+        except Exception as e:
+            _judge_tokenizer_failures[model_name] = time.monotonic()
+            logger.warning(
+                "Judge tokenizer unavailable, truncating prompts by word count",
+                extra={"model": model_name, "error": str(e)},
+            )
+            return None
+
+        _judge_tokenizers[model_name] = tokenizer
+        _judge_tokenizer_failures.pop(model_name, None)
+        return tokenizer
+
+
+async def _get_judge_tokenizer(model_name: str) -> Optional[Any]:
+    """Get the judge model tokenizer, loading it off the event loop once.
+
+    A failed load is not cached for good: it is retried after
+    JUDGE_TOKENIZER_RETRY_SECONDS, and word-count truncation is used until then.
+
+    Args:
+        model_name: Judge model name
+
+    Returns:
+        Tokenizer, or None if it is unavailable
+    """
+    tokenizer = _judge_tokenizers.get(model_name)
+    if tokenizer is not None or _judge_tokenizer_recently_failed(model_name):
+        return tokenizer
+
+    return await asyncio.to_thread(_load_judge_tokenizer, model_name)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, field: str, tokenizer: Optional[Any]) -> str:
+    """Truncate text to a token budget.
+
+    Args:
+        text: Input text
+        max_tokens: Token budget
+        field: Prompt field name (for logging)
+        tokenizer: Judge model tokenizer (None: estimate from word count)
+
+    Returns:
+        Text fitting within the budget
+    """
+    # Every token covers at least one character, so short text always fits
+    if len(text) <= max_tokens:
+        return text
+
+    if tokenizer is not None:
+        token_ids = tokenizer.encode(text, add_special_tokens=False)
+        if len(token_ids) <= max_tokens:
+            return text
+        truncated = tokenizer.decode(token_ids[:max_tokens])
+        original_tokens = len(token_ids)
+    else:
+        words = text.split()
+        max_words = int(max_tokens * _WORDS_PER_TOKEN)
+        if len(words) <= max_words:
+            return text
+        truncated = " ".join(words[:max_words])
+        original_tokens = int(len(words) / _WORDS_PER_TOKEN)
+
+    logger.info(
+        "Truncated judge prompt field",
+        extra={"field": field, "original_tokens": original_tokens, "max_tokens": max_tokens},
+    )
+    return truncated
+
+
+def _format_item(
+    question: str,
+    response: str,
+    reference: Optional[str],
+    context: Optional[str],
+    tokenizer: Optional[Any],
+) -> str:
+    """Render the variable part of a judge prompt in a fixed field order.
+
+    Args:
+        question: Input question
+        response: Model response
+        reference: Reference answer
+        context: Source context
+        tokenizer: Judge model tokenizer (for token-budget truncation)
+
+    Returns:
+        Prompt section for one judged item
+    """
+    question = _truncate_to_tokens(question, PROMPT_TOKEN_BUDGETS["question"], "question", tokenizer)
+    response = _truncate_to_tokens(response, PROMPT_TOKEN_BUDGETS["response"], "response", tokenizer)
+    if reference:
+        reference = _truncate_to_tokens(
+            reference, PROMPT_TOKEN_BUDGETS["reference"], "reference", tokenizer
+        )
+    if context:
+        context = _truncate_to_tokens(context, PROMPT_TOKEN_BUDGETS["context"], "context", tokenizer)
+
+    return (
+        f"### Question\n{question}\n"
+        f"### Response\n{response}\n"
+        f"### Reference\n{reference or ''}\n"
+        f"### Context\n{context or ''}"
+    )
 
 
 class ResponseQualityEvaluator:
     """Evaluate response quality using LLM-as-judge approach."""
 
-    def __init__(self, llm_service_url: str = "http://llm-service:8002"):
+    def __init__(
+        self,
+        llm_service_url: str = "http://llm-service:8002",
+        concurrency: int = 8,
+        cache_size: int = 10_000,
+        judge_batch_size: int = 8,
+        judge_model: Optional[str] = None,
+        calibration: Optional[Dict[str, List[float]]] = None,
+    ):
         """Initialize response quality evaluator.
 
         Args:
             llm_service_url: URL of LLM service
+            concurrency: Maximum number of in-flight LLM judgments per batch
+            cache_size: Maximum number of cached judgments (0 disables caching)
+            judge_batch_size: Number of responses packed into one judge prompt
+            judge_model: Judge model name (defaults to EVALUATION_MODEL)
+            calibration: Per-criterion [a, b] correction applied as a*x + b
+                (defaults to EVALUATION_JUDGE_CALIBRATION)
         """
         self.llm_service_url = llm_service_url
+        self.concurrency = concurrency
+        self.cache_size = cache_size
+        self.judge_batch_size = max(1, judge_batch_size)
+        self._breaker = CircuitBreaker()
+        self.judge_model = judge_model or config.EVALUATION_MODEL
+        self.calibration = (
+            calibration if calibration is not None else config.EVALUATION_JUDGE_CALIBRATION
+        )
+        self._judgment_cache: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
 
     async def evaluate_response_quality(
         self,
@@ -39,15 +468,32 @@ class ResponseQualityEvaluator:
         Returns:
             Quality metrics (0-5 scale)
         """
+        cache_key = self._cache_key(question, response, reference, context)
+        cached = self._judgment_cache.get(cache_key)
+        if cached is not None:
+            self._judgment_cache.move_to_end(cache_key)
+            return dict(cached)
+
         evaluation_prompt = self._build_evaluation_prompt(
-            question, response, reference, context
+            question, response, reference, context, await _get_judge_tokenizer(self.judge_model)
         )
 
         try:
             llm_judgment = await self._get_llm_judgment(evaluation_prompt)
-            metrics = self._parse_judgment(llm_judgment)
+            metrics, valid = self._parse_judgment(llm_judgment)
+            # Fallback or clamped scores are not cached, so the next call
+            # asks the judge again
+            if valid:
+                self._store_judgment(cache_key, metrics)
             return metrics
 
+        except CircuitOpenError:
+            logger.debug(
+                "LLM judge circuit open, using default scores",
+                extra={"question": question[:100]},
+            )
+            return dict(DEFAULT_SCORES)
+
         except Exception as e:
             logger.error(
                 "LLM judgment failed",
@@ -55,22 +501,16 @@ class ResponseQualityEvaluator:
                 exc_info=True,
             )
             # Return default scores on failure
-            return {
-                "relevance": 2.5,
-                "correctness": 2.5,
-                "completeness": 2.5,
-                "clarity": 2.5,
-                "overall": 2.5,
-            }
+            return dict(DEFAULT_SCORES)
 
-    def _build_evaluation_prompt(
+    def _cache_key(
         self,
         question: str,
         response: str,
         reference: Optional[str],
         context: Optional[str],
     ) -> str:
-        """Build evaluation prompt for LLM judge.
+        """Build judgment cache key from the evaluated inputs.
 
         Args:
             question: Input question
@@ -79,119 +519,303 @@ class ResponseQualityEvaluator:
             context: Source context
 
         Returns:
-            Evaluation prompt
+            SHA-256 hex digest of the canonicalized inputs
         """
-        prompt = f"""Evaluate the quality of the following response on a scale of 1-5 for each criterion.
+        payload = orjson.dumps([question, response, reference, context])
+        return hashlib.sha256(payload).hexdigest()
 
-Question: {question}
+    def _store_judgment(self, cache_key: str, metrics: Dict[str, float]) -> None:
+        """Store judgment in the LRU cache, evicting the oldest entry if full.
 
-Response to evaluate:
-{response}
+        Args:
+            cache_key: Key from _cache_key
+            metrics: Parsed judgment metrics
+        """
+        if self.cache_size <= 0:
+            return
 
-"""
+        self._judgment_cache[cache_key] = dict(metrics)
+        self._judgment_cache.move_to_end(cache_key)
+        if len(self._judgment_cache) > self.cache_size:
+            self._judgment_cache.popitem(last=False)
 
-        if reference:
-            prompt += f"Reference answer:\n{reference}\n\n"
+    def _build_evaluation_prompt(
+        self,
+        question: str,
+        response: str,
+        reference: Optional[str],
+        context: Optional[str],
+        tokenizer: Optional[Any] = None,
+    ) -> str:
+        """Build evaluation prompt for LLM judge.
+
+        Args:
+            question: Input question
+            response: Model response
+            reference: Reference answer
+            context: Source context
+            tokenizer: Judge model tokenizer (for token-budget truncation)
 
-        if context:
-            prompt += f"Source context:\n{context}\n\n"
+        Returns:
+            Evaluation prompt
+        """
+        return _format_item(question, response, reference, context, tokenizer)
 
-        prompt += """Evaluate on these criteria:
-1. Relevance (1-5): How relevant is the response to the question?
-2. Correctness (1-5): Is the information factually correct?
-3. Completeness (1-5): Does it fully address the question?
-4. Clarity (1-5): Is the response clear and well-structured?
+    def _build_batch_evaluation_prompt(
+        self,
+        items: List[Tuple[str, str, Optional[str]]],
+        tokenizer: Optional[Any] = None,
+    ) -> str:
+        """Build a single evaluation prompt covering several responses.
 
-Provide scores in JSON format:
-{
-  "relevance": <score 1-5>,
-  "correctness": <score 1-5>,
-  "completeness": <score 1-5>,
-  "clarity": <score 1-5>,
-  "reasoning": "<brief explanation>"
-}"""
+        Args:
+            items: List of (question, response, reference) tuples
+            tokenizer: Judge model tokenizer (for token-budget truncation)
 
-        return prompt
+        Returns:
+            Evaluation prompt
+        """
+        return "\n\n".join(
+            f"## Item {number}\n{_format_item(question, response, reference, None, tokenizer)}"
+            for number, (question, response, reference) in enumerate(items, start=1)
+        )
 
-    async def _get_llm_judgment(self, prompt: str) -> str:
+    async def _get_llm_judgment(
+        self,
+        prompt: str,
+        max_tokens: int = JUDGE_MAX_TOKENS,
+        system_prompt: str = JUDGE_SYSTEM_PROMPT,
+    ) -> str:
         """Get judgment from LLM service.
 
         Args:
-            prompt: Evaluation prompt
+            prompt: Evaluation prompt (per-item content)
+            max_tokens: Maximum tokens the judge may generate
+            system_prompt: Static judge instructions
 
         Returns:
             LLM judgment (JSON string)
+
+        Raises:
+            CircuitOpenError: If recent calls kept failing and the breaker is open
         """
-        import httpx
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.llm_service_url}/v1/chat/completions",
-                json={
-                    "model": "meta-llama/Llama-3.1-8B-Instruct-AWQ",
-                    "messages": [
-                        {"role": "system", "content": "You are an expert evaluator of response quality."},
-                        {"role": "user", "content": prompt},
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 500,
-                },
-                timeout=30.0,
-            )
-            response.raise_for_status()
+        if not self._breaker.allow():
+            raise CircuitOpenError("LLM judge circuit breaker is open")
+
+        client = await get_http_client()
+        payload = {
+            "model": self.judge_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            # Greedy decoding keeps scores deterministic, so cached judgments
+            # match what a fresh call would return
+            "temperature": 0.0,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"},
+        }
+
+        try:
+            # Back off and retry on rate limiting / transient 5xx responses
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception(_is_transient_error),
+                wait=wait_exponential(multiplier=0.5, max=4),
+                stop=stop_after_attempt(3),
+                reraise=True,
+            ):
+                with attempt:
+                    response = await client.post(
+                        f"{self.llm_service_url}/v1/chat/completions",
+                        json=payload,
+                        timeout=30.0,
+                    )
+                    response.raise_for_status()
 
             result = response.json()
-            return result["choices"][0]["message"]["content"]
+            judgment = result["choices"][0]["message"]["content"]
+
+        except Exception:
+            self._breaker.record_failure()
+            raise
 
-    def _parse_judgment(self, judgment_text: str) -> Dict[str, float]:
+        self._breaker.record_success()
+        return judgment
+
+    def _parse_judgment(self, judgment_text: str) -> Tuple[Dict[str, float], bool]:
         """Parse LLM judgment into metrics.
 
         Args:
             judgment_text: LLM judgment text
 
         Returns:
-            Metrics dictionary
+            Tuple of (metrics, valid); valid is False when no JSON was found
+            or it failed schema validation, and metrics are fallback scores
         """
         try:
             # Extract JSON from response
-            import re
-            json_match = re.search(r"\{.*\}", judgment_text, re.DOTALL)
+            json_text = _extract_json(judgment_text)
 
-            if json_match:
-                judgment_json = json.loads(json_match.group())
+            if json_text is not None:
+                judgment_json = orjson.loads(json_text)
+                return self._scores_from_json(judgment_json)
 
-                # Extract scores
-                relevance = float(judgment_json.get("relevance", 2.5))
-                correctness = float(judgment_json.get("correctness", 2.5))
-                completeness = float(judgment_json.get("completeness", 2.5))
-                clarity = float(judgment_json.get("clarity", 2.5))
+        except Exception as e:
+            logger.warning(
+                "Failed to parse judgment",
+                extra={"error": str(e)},
+            )
+
+        # Default scores
+        return dict(DEFAULT_SCORES), False
 
-                # Calculate overall score (average)
-                overall = (relevance + correctness + completeness + clarity) / 4
+    def _parse_batch_judgment(
+        self,
+        judgment_text: str,
+        expected_count: int,
+    ) -> Optional[List[Tuple[Dict[str, float], bool]]]:
+        """Parse a multi-item LLM judgment into per-item metrics.
 
-                return {
-                    "relevance": min(5.0, max(1.0, relevance)),
-                    "correctness": min(5.0, max(1.0, correctness)),
-                    "completeness": min(5.0, max(1.0, completeness)),
-                    "clarity": min(5.0, max(1.0, clarity)),
-                    "overall": min(5.0, max(1.0, overall)),
-                }
+        Args:
+            judgment_text: LLM judgment text
+            expected_count: Number of items that were judged
+
+        Returns:
+            (metrics, valid) per item as from _scores_from_json, or None if
+            the output is unusable
+        """
+        try:
+            json_text = _extract_json(judgment_text)
+
+            if json_text is not None:
+                results = orjson.loads(json_text).get("results")
+
+                if isinstance(results, list) and len(results) == expected_count:
+                    return [self._scores_from_json(item) for item in results]
 
         except Exception as e:
             logger.warning(
-                "Failed to parse judgment",
+                "Failed to parse batch judgment",
                 extra={"error": str(e)},
             )
 
-        # Default scores
-        return {
-            "relevance": 2.5,
-            "correctness": 2.5,
-            "completeness": 2.5,
-            "clarity": 2.5,
-            "overall": 2.5,
+        return None
+
+    def _scores_from_json(self, judgment_json: Dict[str, Any]) -> Tuple[Dict[str, float], bool]:
+        """Convert a parsed judgment object into metrics.
+
+        Valid judgments are used as-is; malformed or calibrated ones fall back
+        to defaults for missing fields and are clamped to 1-5.
+
+        Args:
+            judgment_json: Parsed judgment object
+
+        Returns:
+            Tuple of (metrics, valid); valid is True if the judgment passed
+            _validate_judgment
+        """
+        error = _validate_judgment(judgment_json)
+
+        # Fast path: well-formed, in-range scores need no defaults or clamping
+        if error is None and not self.calibration:
+            scores = {key: float(judgment_json[key]) for key in JUDGE_CRITERIA}
+            scores["overall"] = sum(scores.values()) / len(JUDGE_CRITERIA)
+            return scores, True
+
+        if error is not None:
+            logger.warning(
+                "Judgment failed schema validation",
+                extra={"error": error, "judge_model": self.judge_model},
+            )
+
+        scores = {
+            key: self._calibrate(key, float(judgment_json.get(key, 2.5)))
+            for key in JUDGE_CRITERIA
         }
 
+        # Calculate overall score (average)
+        scores["overall"] = sum(scores.values()) / len(JUDGE_CRITERIA)
+
+        return {key: min(5.0, max(1.0, score)) for key, score in scores.items()}, error is None
+
+    def _calibrate(self, criterion: str, score: float) -> float:
+        """Apply the configured linear correction for a criterion.
+
+        Args:
+            criterion: Criterion name
+            score: Raw judge score
+
+        Returns:
+            Calibrated score
+        """
+        coefficients = self.calibration.get(criterion)
+        if not coefficients:
+            return score
+
+        a, b = coefficients
+        return a * score + b
+
+    async def _evaluate_judge_batch(
+        self,
+        items: List[Tuple[str, str, Optional[str]]],
+    ) -> List[Dict[str, float]]:
+        """Judge several responses with one LLM call.
+
+        Cached items are served directly. If the judge output does not
+        contain one result per item, each item is judged individually.
+
+        Args:
+            items: List of (question, response, reference) tuples
+
+        Returns:
+            Metrics per item, in input order
+        """
+        results: List[Optional[Dict[str, float]]] = [None] * len(items)
+        pending: List[int] = []
+
+        for i, (question, response, reference) in enumerate(items):
+            cached = self._judgment_cache.get(self._cache_key(question, response, reference, None))
+            if cached is not None:
+                results[i] = dict(cached)
+            else:
+                pending.append(i)
+
+        if len(pending) > 1:
+            pending_items = [items[i] for i in pending]
+            batch_metrics = None
+
+            try:
+                llm_judgment = await self._get_llm_judgment(
+                    self._build_batch_evaluation_prompt(
+                        pending_items, await _get_judge_tokenizer(self.judge_model)
+                    ),
+                    max_tokens=BATCH_TOKENS_PER_ITEM * len(pending_items),
+                    system_prompt=BATCH_JUDGE_SYSTEM_PROMPT,
+                )
+                batch_metrics = self._parse_batch_judgment(llm_judgment, len(pending_items))
+            except Exception as e:
+                logger.warning(
+                    "Batch LLM judgment failed, judging items individually",
+                    extra={"error": str(e), "batch_size": len(pending_items)},
+                )
+
+            if batch_metrics is not None:
+                for i, (metrics, valid) in zip(pending, batch_metrics):
+                    question, response, reference = items[i]
+                    if valid:
+                        self._store_judgment(self._cache_key(question, response, reference, None), metrics)
+                    results[i] = metrics
+                pending = []
+
+        if pending:
+            individual = await asyncio.gather(
+                *(self.evaluate_response_quality(*items[i]) for i in pending)
+            )
+            for i, metrics in zip(pending, individual):
+                results[i] = metrics
+
+        return results
+
     async def evaluate_batch_quality(
         self,
         questions: List[str],
@@ -211,28 +835,77 @@ Provide scores in JSON format:
         if len(questions) != len(responses):
             raise ValueError("Questions and responses must have equal length")
 
-        all_metrics = []
+        items = [
+            (
+                question,
+                response,
+                references[i] if references and i < len(references) else None,
+            )
+            for i, (question, response) in enumerate(zip(questions, responses))
+        ]
+
+        # Judge each distinct (question, response, reference) once; duplicates
+        # such as boilerplate refusals are fanned back out afterwards
+        first_index: Dict[Tuple[str, str, Optional[str]], int] = {}
+        unique_items: List[Tuple[str, str, Optional[str]]] = []
+        redirect: List[int] = []
+        for item in items:
+            index = first_index.get(item)
+            if index is None:
+                index = first_index[item] = len(unique_items)
+                unique_items.append(item)
+            redirect.append(index)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _evaluate_chunk(
+            chunk: List[Tuple[str, str, Optional[str]]],
+        ) -> List[Dict[str, float]]:
+            async with semaphore:
+                return await self._evaluate_judge_batch(chunk)
+
+        # Pack judge_batch_size items per LLM call and dispatch chunks concurrently
+        size = self.judge_batch_size
+        chunk_metrics = await asyncio.gather(
+            *(
+                _evaluate_chunk(unique_items[i:i + size])
+                for i in range(0, len(unique_items), size)
+            )
+        )
+        unique_metrics = [metrics for chunk in chunk_metrics for metrics in chunk]
+        all_metrics = [unique_metrics[index] for index in redirect]
 
-        for i, (question, response) in enumerate(zip(questions, responses)):
-            reference = references[i] if references and i < len(references) else None
+        # Aggregate metrics: stack into an (N, 5) array and take column means
+        scores = np.array(
+            [[m[key] for key in QUALITY_METRIC_KEYS] for m in all_metrics],
+            dtype=np.float64,
+        )
+        means = scores.mean(axis=0)
 
-            metrics = await self.evaluate_response_quality(
-                question, response, reference
-            )
-            all_metrics.append(metrics)
-
-        # Aggregate metrics
-        aggregated = {
-            "relevance": sum(m["relevance"] for m in all_metrics) / len(all_metrics),
-            "correctness": sum(m["correctness"] for m in all_metrics) / len(all_metrics),
-            "completeness": sum(m["completeness"] for m in all_metrics) / len(all_metrics),
-            "clarity": sum(m["clarity"] for m in all_metrics) / len(all_metrics),
-            "overall": sum(m["overall"] for m in all_metrics) / len(all_metrics),
-            "sample_count": len(all_metrics),
+        aggregated: Dict[str, float] = {
+            key: float(mean) for key, mean in zip(QUALITY_METRIC_KEYS, means)
         }
+        aggregated["sample_count"] = len(all_metrics)
 
         return aggregated
 
+    def evaluate_text_quality(self, response: str) -> Dict[str, Dict[str, float]]:
+        """Evaluate length and language quality from a single tokenization.
+
+        Args:
+            response: Model response
+
+        Returns:
+            Dict with "length" and "language" metrics
+        """
+        words = response.split()
+        sentences = self._split_sentences(response)
+
+        return {
+            "length": self._length_metrics(words, sentences),
+            "language": self._language_metrics(words, sentences),
+        }
+
     def evaluate_response_length(self, response: str) -> Dict[str, float]:
         """Evaluate response length appropriateness.
 
@@ -242,40 +915,77 @@ Provide scores in JSON format:
         Returns:
             Length metrics
         """
-        words = len(response.split())
-        sentences = len(response.split("."))
+        return self._length_metrics(response.split(), self._split_sentences(response))
+
+    def evaluate_language_quality(self, response: str) -> Dict[str, float]:
+        """Evaluate language quality (grammar, fluency).
+
+        Args:
+            response: Model response
+
+        Returns:
+            Language quality metrics
+        """
+        return self._language_metrics(response.split(), self._split_sentences(response))
+
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        """Split text into non-empty sentences.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Sentences
+        """
+        return [s for s in _SENT_RE.split(text) if s.strip()]
+
+    def _length_metrics(self, words: List[str], sentences: List[str]) -> Dict[str, float]:
+        """Compute length metrics from pre-split words and sentences.
+
+        Args:
+            words: Response words
+            sentences: Response sentences
+
+        Returns:
+            Length metrics
+        """
+        word_count = len(words)
+        sentence_count = len(sentences)
 
         # Ideal response: 50-200 words
         length_score = 1.0
-        if words < 20:
+        if word_count < 20:
             length_score = 0.5  # Too short
-        elif words > 300:
+        elif word_count > 300:
             length_score = 0.7  # Too long but acceptable
 
         return {
-            "word_count": words,
-            "sentence_count": sentences,
-            "avg_sentence_length": words / max(1, sentences),
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "avg_sentence_length": word_count / max(1, sentence_count),
             "length_score": length_score,
         }
 
-    def evaluate_language_quality(self, response: str) -> Dict[str, float]:
-        """Evaluate language quality (grammar, fluency).
+    def _language_metrics(self, words: List[str], sentences: List[str]) -> Dict[str, float]:
+        """Compute language quality metrics from pre-split words and sentences.
 
         Args:
-            response: Model response
+            words: Response words
+            sentences: Response sentences
 
         Returns:
             Language quality metrics
         """
-        # Simple language quality check
-        words = response.split()
-        sentences = [s.strip() for s in response.split(".") if s.strip()]
+        # Single pass over sentences for both length checks
+        fragment_sentences = 0
+        long_sentences = 0
+        for sentence in sentences:
+            n = len(sentence.split())
+            fragment_sentences += n < 3
+            long_sentences += n > 30
 
-        # Check for common issues
-        repeated_words = self._check_repeated_words(response)
-        fragment_sentences = sum(1 for s in sentences if len(s.split()) < 3)
-        long_sentences = sum(1 for s in sentences if len(s.split()) > 30)
+        repeated_words = self._check_repeated_words(words)
 
         quality_score = 1.0
         if repeated_words > 3:
@@ -293,20 +1003,16 @@ Provide scores in JSON format:
             "sentence_count": len(sentences),
         }
 
-    def _check_repeated_words(self, text: str) -> int:
+    def _check_repeated_words(self, words: List[str]) -> int:
         """Check for repeated words.
 
         Args:
-            text: Input text
+            words: Response words
 
         Returns:
             Number of repeated word instances
         """
-        words = text.lower().split()
-        word_counts = {}
-
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
+        word_counts = Counter(word.lower() for word in words)
 
         # Count words that appear more than 3 times
         repeated = sum(1 for count in word_counts.values() if count > 3)
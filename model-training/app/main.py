@@ -10,7 +10,9 @@ from fastapi import FastAPI, Header
 from fastapi.responses import JSONResponse
 
 from app.config import get_config
+from app.evaluation.response_quality import close_http_client
 from app.routers import evaluate, finetune, health
+from app.utils.jobstore import close_redis
 from app.utils.logging_config import setup_json_logging
 
 # Setup logging
@@ -23,9 +25,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan management."""
     # Startup
     logger.info("Model training service starting", extra={"version": config.SERVICE_VERSION})
+    await finetune.fail_interrupted_jobs()
+    finetune.start_training_workers()
     yield
     # Shutdown
     logger.info("Model training service shutting down")
+    await finetune.stop_training_workers()
+    await close_http_client()
+    await close_redis()
+    evaluate.shutdown_benchmark_pool()
 
 
 # Create FastAPI app
@@ -40,7 +48,10 @@ app = FastAPI(
 @app.middleware("http")
 async def request_id_middleware(request, call_next):
     """Add request ID tracking."""
-    request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+    # Only generate an ID when the caller did not supply one
+    request_id = request.headers.get("X-Request-ID")
+    if request_id is None:
+        request_id = uuid.uuid4().hex
     request.state.request_id = request_id
 
     response = await call_next(request)
@@ -68,7 +79,9 @@ async def root(x_request_id: Optional[str] = Header(None)):
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    request_id = getattr(request.state, "request_id", str(uuid.uuid4()))
+    request_id = getattr(request.state, "request_id", None)
+    if request_id is None:
+        request_id = uuid.uuid4().hex
     logger.error(
         "Unhandled exception",
         extra={
@@ -1,16 +1,21 @@
 """Evaluation API endpoints."""
 
+import os
 import uuid
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 
-from fastapi import APIRouter, HTTPException, Header
+import orjson
+from fastapi import APIRouter, HTTPException, Header, Request
 from pydantic import BaseModel, Field
 
 from app.config import get_config
 from app.evaluation.benchmark_suite import BenchmarkSuite
 from app.evaluation.metrics_reporter import MetricsReporter
+from app.utils.jobstore import JobStore
+from app.utils.jsonl import iter_jsonl
 from app.utils.logging_config import setup_json_logging
 from app.utils.metrics import record_evaluation_job
 
@@ -19,8 +24,67 @@ logger = setup_json_logging("evaluate")
 config = get_config()
 router = APIRouter()
 
-# In-memory evaluation job tracking
-_eval_jobs: Dict[str, Dict[str, Any]] = {}
+# Evaluation job tracking (Redis-backed so any worker can serve status)
+_eval_jobs = JobStore("eval_job")
+
+# Background evaluation tasks currently running in this worker
+_eval_tasks: Set[asyncio.Task] = set()
+
+# Benchmarks are CPU-bound, so they run in worker processes instead of threads
+_benchmark_pool: Optional[ProcessPoolExecutor] = None
+_worker_suite: Optional[BenchmarkSuite] = None
+
+
+def _init_benchmark_worker() -> None:
+    """Build the per-process benchmark suite once at worker start."""
+    global _worker_suite
+    _worker_suite = BenchmarkSuite()
+
+
+def _run_benchmark_in_worker(
+    eval_dataset_path: str,
+    sources: Optional[List[List[str]]],
+) -> Dict[str, Any]:
+    """Load the dataset and run the complete benchmark inside a pool worker.
+
+    The dataset is read once here, so predictions never have to be built in
+    the API process and pickled across to the worker.
+    """
+    eval_data = list(iter_jsonl(eval_dataset_path))
+    if not eval_data:
+        raise ValueError("Evaluation dataset is empty")
+
+    # Dummy predictions; in production, load from model
+    predictions = [
+        item.get("output", "Model response for: " + item.get("input", ""))
+        for item in eval_data
+    ]
+
+    return _worker_suite.run_complete_benchmark(
+        eval_dataset_path, predictions, sources, eval_data=eval_data
+    )
+
+
+def _get_benchmark_pool() -> ProcessPoolExecutor:
+    """Get the benchmark process pool, creating it on first use."""
+    global _benchmark_pool
+
+    if _benchmark_pool is None:
+        _benchmark_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_benchmark_worker,
+        )
+
+    return _benchmark_pool
+
+
+def shutdown_benchmark_pool() -> None:
+    """Shut down the benchmark process pool if it was started."""
+    global _benchmark_pool
+
+    if _benchmark_pool is not None:
+        _benchmark_pool.shutdown(wait=False, cancel_futures=True)
+        _benchmark_pool = None
 
 
 class EvaluateRequest(BaseModel):
@@ -44,28 +108,31 @@ class EvaluateRequest(BaseModel):
     )
 
 
-class EvaluationResult(BaseModel):
-    """Evaluation results."""
+class EvaluationJobResponse(BaseModel):
+    """Response from queueing an evaluation job."""
 
+    job_id: str
+    status: str
     model_version: str
-    results: Dict[str, Any]
-    eval_samples: int
-    evaluated_at: str
+    created_at: str
 
 
-@router.post("", response_model=EvaluationResult)
+@router.post("", response_model=EvaluationJobResponse, status_code=202)
 async def run_evaluation(
     request: EvaluateRequest,
     x_request_id: Optional[str] = Header(None),
-) -> EvaluationResult:
-    """Run model evaluation.
+) -> EvaluationJobResponse:
+    """Queue a model evaluation job.
+
+    The benchmark runs in the background; poll `GET /evaluate/{job_id}`
+    for status and results.
 
     Args:
         request: Evaluation request
         x_request_id: Request ID header
 
     Returns:
-        Evaluation results
+        Queued evaluation job
     """
     job_id = str(uuid.uuid4())
 
@@ -79,61 +146,65 @@ async def run_evaluation(
         },
     )
 
+    if not os.path.isfile(request.eval_dataset):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": {
+                    "code": "INVALID_REQUEST",
+                    "message": f"Evaluation dataset not found: {request.eval_dataset}",
+                    "request_id": x_request_id,
+                }
+            },
+        )
+
     record_evaluation_job(request.model_version, "started")
 
+    created_at = datetime.utcnow().isoformat() + "Z"
+    await _eval_jobs.set(job_id, {
+        "status": "queued",
+        "model_version": request.model_version,
+        "eval_dataset": request.eval_dataset,
+        "progress": 0.0,
+        "created_at": created_at,
+        "updated_at": created_at,
+    })
+
+    # Keep a reference so the task is not garbage-collected while running
+    task = asyncio.create_task(_run_evaluation_job(job_id, request))
+    _eval_tasks.add(task)
+    task.add_done_callback(_eval_tasks.discard)
+
+    return EvaluationJobResponse(
+        job_id=job_id,
+        status="queued",
+        model_version=request.model_version,
+        created_at=created_at,
+    )
+
+
+async def _run_evaluation_job(job_id: str, request: EvaluateRequest) -> None:
+    """Run evaluation job in background.
+
+    Args:
+        job_id: Job ID
+        request: Evaluation request
+    """
     try:
+        await _eval_jobs.update(job_id, {
+            "status": "running",
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+        })
+
         # Initialize benchmark suite
         benchmark_suite = BenchmarkSuite()
 
-        # Load evaluation dataset
-        import json
-        eval_data = []
-        try:
-            with open(request.eval_dataset, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        eval_data.append(json.loads(line))
-        except Exception as e:
-            logger.error(
-                "Failed to load evaluation dataset",
-                extra={"path": request.eval_dataset, "error": str(e)},
-                exc_info=True,
-            )
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": {
-                        "code": "INVALID_REQUEST",
-                        "message": f"Failed to load evaluation dataset: {str(e)}",
-                        "request_id": x_request_id,
-                    }
-                },
-            )
-
-        if not eval_data:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": {
-                        "code": "INVALID_REQUEST",
-                        "message": "Evaluation dataset is empty",
-                        "request_id": x_request_id,
-                    }
-                },
-            )
-
-        # Generate dummy predictions (in production, load from model)
-        predictions = [
-            item.get("output", "Model response for: " + item.get("input", ""))
-            for item in eval_data
-        ]
-
         # Load source documents if provided
         sources = None
         if request.source_documents:
             try:
-                with open(request.source_documents, "r", encoding="utf-8") as f:
-                    sources = json.load(f)
+                with open(request.source_documents, "rb") as f:
+                    sources = orjson.loads(f.read())
             except Exception as e:
                 logger.warning(
                     "Failed to load source documents",
@@ -142,20 +213,25 @@ async def run_evaluation(
 
         # Run benchmark
         logger.info("Running benchmark suite", extra={"job_id": job_id})
-        results = await asyncio.to_thread(
-            benchmark_suite.run_complete_benchmark,
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(
+            _get_benchmark_pool(),
+            _run_benchmark_in_worker,
             request.eval_dataset,
-            predictions,
             sources,
         )
+        eval_samples = results.get("sample_count", 0)
 
         # Generate reports
         reporter = MetricsReporter()
 
         logger.info("Generating evaluation reports", extra={"job_id": job_id})
 
+        report_dir = f"/tmp/eval_reports/{job_id}"
+        os.makedirs(report_dir, exist_ok=True)
+
         # Save JSON report
-        json_report_path = f"/tmp/eval_reports/{job_id}/results.json"
+        json_report_path = f"{report_dir}/results.json"
         reporter.generate_json_report(
             results.get("metrics", {}),
             request.model_version,
@@ -163,7 +239,7 @@ async def run_evaluation(
         )
 
         # Save markdown report
-        markdown_report_path = f"/tmp/eval_reports/{job_id}/report.md"
+        markdown_report_path = f"{report_dir}/report.md"
         benchmark_suite.generate_benchmark_report(
             results,
             markdown_report_path,
@@ -171,24 +247,25 @@ async def run_evaluation(
 
         record_evaluation_job(request.model_version, "completed")
 
+        evaluated_at = datetime.utcnow().isoformat() + "Z"
+        await _eval_jobs.update(job_id, {
+            "status": "completed",
+            "progress": 1.0,
+            "results": results.get("metrics", {}),
+            "eval_samples": eval_samples,
+            "evaluated_at": evaluated_at,
+            "updated_at": evaluated_at,
+        })
+
         logger.info(
             "Evaluation job completed",
             extra={
                 "job_id": job_id,
                 "model_version": request.model_version,
-                "eval_samples": len(eval_data),
+                "eval_samples": eval_samples,
             },
         )
 
-        return EvaluationResult(
-            model_version=request.model_version,
-            results=results.get("metrics", {}),
-            eval_samples=len(eval_data),
-            evaluated_at=datetime.utcnow().isoformat() + "Z",
-        )
-
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(
             "Evaluation failed",
@@ -202,36 +279,37 @@ async def run_evaluation(
 
         record_evaluation_job(request.model_version, "failed")
 
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": f"Evaluation failed: {str(e)}",
-                    "request_id": x_request_id,
-                }
-            },
-        )
+        await _eval_jobs.update(job_id, {
+            "status": "failed",
+            "error_message": str(e),
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+        })
 
 
 @router.get("/{job_id}")
 async def get_evaluation_status(
     job_id: str,
+    request: Request,
     x_request_id: Optional[str] = Header(None),
 ) -> Dict[str, Any]:
     """Get evaluation job status.
 
     Args:
         job_id: Job ID
+        request: Incoming request (carries the middleware-assigned request ID)
         x_request_id: Request ID header
 
     Returns:
         Evaluation status
     """
-    if job_id not in _eval_jobs:
+    job = await _eval_jobs.get(job_id)
+
+    if job is None:
+        # Reuse the ID assigned by the middleware rather than generating one
+        request_id = x_request_id or getattr(request.state, "request_id", None)
         logger.warning(
             "Evaluation job not found",
-            extra={"job_id": job_id, "request_id": x_request_id},
+            extra={"job_id": job_id, "request_id": request_id},
         )
         raise HTTPException(
             status_code=404,
@@ -239,17 +317,20 @@ async def get_evaluation_status(
                 "error": {
                     "code": "NOT_FOUND",
                     "message": f"Evaluation job {job_id} not found",
-                    "request_id": x_request_id,
+                    "request_id": request_id,
                 }
             },
         )
 
-    job = _eval_jobs[job_id]
     return {
         "job_id": job_id,
         "status": job.get("status"),
         "model_version": job.get("model_version"),
         "progress": job.get("progress", 0.0),
+        "results": job.get("results"),
+        "eval_samples": job.get("eval_samples"),
+        "evaluated_at": job.get("evaluated_at"),
+        "error_message": job.get("error_message"),
         "created_at": job.get("created_at"),
         "updated_at": job.get("updated_at"),
     }
@@ -1,28 +1,65 @@
 """Fine-tuning API endpoints."""
 
+import time
 import uuid
 import asyncio
+import concurrent.futures
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List
 import json
 
-from fastapi import APIRouter, HTTPException, Header, BackgroundTasks
+import orjson
+from fastapi import APIRouter, HTTPException, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.config import get_config
 from app.training.data_preparer import DataPreparer
 from app.training.lora_trainer import LoRATrainer
 from app.training.training_config import get_default_training_config
+from app.utils.jobstore import JobStore
 from app.utils.logging_config import setup_json_logging
 from app.utils.metrics import record_training_job
 
 
 logger = setup_json_logging("finetune")
 config = get_config()
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# In-memory job tracking (in production, use Redis or database)
-_training_jobs: Dict[str, Dict[str, Any]] = {}
+# Training job tracking (Redis-backed so state survives restarts and can be
+# read by any worker)
+_training_jobs = JobStore("training_job")
+
+# Pending jobs, consumed by MAX_CONCURRENT_TRAINING_JOBS long-lived workers.
+# Admission and execution are per process; the service runs a single
+# uvicorn worker, which owns every queued and running job.
+_job_queue: Optional[asyncio.Queue] = None
+_workers: List[asyncio.Task] = []
+
+# Statuses of jobs that have not finished yet
+_UNFINISHED_STATUSES = ("started", "running")
+
+# Idle interval after which the status stream sends a keepalive comment
+STATUS_STREAM_KEEPALIVE_SECONDS = 15.0
+
+
+def _timestamp_fields(prefix: str = "updated") -> Dict[str, Any]:
+    """Build the ISO string and epoch float fields for the current time.
+
+    The float is stored alongside the string so elapsed time can be computed
+    by subtraction instead of parsing ISO strings on every status poll.
+
+    Args:
+        prefix: Field prefix ("created" or "updated")
+
+    Returns:
+        Fields `{prefix}_at` and `_{prefix}_ts`
+    """
+    ts = time.time()
+    return {
+        f"{prefix}_at": datetime.utcfromtimestamp(ts).isoformat() + "Z",
+        f"_{prefix}_ts": ts,
+    }
 
 
 class FinetuneStartRequest(BaseModel):
@@ -68,17 +105,33 @@ class FinetuneStatusResponse(BaseModel):
     updated_at: str
 
 
+class FinetuneStatusBatchRequest(BaseModel):
+    """Request for the status of several fine-tuning jobs."""
+
+    job_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Job IDs to look up (max 500)"
+    )
+
+
+class FinetuneStatusBatchResponse(BaseModel):
+    """Statuses of several fine-tuning jobs."""
+
+    jobs: List[FinetuneStatusResponse]
+    not_found: List[str]
+
+
 @router.post("/start", response_model=FinetuneStartResponse)
 async def start_finetune(
     request: FinetuneStartRequest,
-    background_tasks: BackgroundTasks,
     x_request_id: Optional[str] = Header(None),
 ) -> FinetuneStartResponse:
     """Start a fine-tuning job.
 
     Args:
         request: Fine-tuning start request
-        background_tasks: Background task runner
         x_request_id: Request ID header
 
     Returns:
@@ -96,52 +149,48 @@ async def start_finetune(
         },
     )
 
-    # Check concurrent job limit
-    active_jobs = sum(
-        1 for j in _training_jobs.values()
-        if j.get("status") in ["started", "running"]
-    )
+    if _job_queue is None:
+        _raise_not_ready(x_request_id)
 
-    if active_jobs >= config.MAX_CONCURRENT_TRAINING_JOBS:
-        logger.warning(
-            "Max concurrent jobs reached",
-            extra={"active_jobs": active_jobs, "request_id": x_request_id},
-        )
-        raise HTTPException(
-            status_code=429,
-            detail={
-                "error": {
-                    "code": "RATE_LIMIT_EXCEEDED",
-                    "message": f"Maximum concurrent training jobs ({config.MAX_CONCURRENT_TRAINING_JOBS}) reached",
-                    "request_id": x_request_id,
-                }
-            },
-        )
+    # Reject when the queue of jobs waiting for a training worker is full
+    if _job_queue.full():
+        _raise_queue_full(x_request_id)
 
     # Initialize job tracking
-    _training_jobs[job_id] = {
+    created = _timestamp_fields("created")
+    created_at = created["created_at"]
+    await _training_jobs.set(job_id, {
         "status": "started",
         "base_model": request.base_model,
         "dataset_path": request.dataset_path,
         "hyperparameters": request.hyperparameters or {},
-        "created_at": datetime.utcnow().isoformat() + "Z",
-        "updated_at": datetime.utcnow().isoformat() + "Z",
+        **created,
+        "updated_at": created_at,
+        "_updated_ts": created["_created_ts"],
         "progress": 0.0,
         "steps_completed": 0,
         "total_steps": 0,
         "training_loss": None,
         "eval_loss": None,
         "error_message": None,
-    }
+    })
 
-    # Schedule background training
-    background_tasks.add_task(
-        _run_finetune_job,
-        job_id,
-        request.base_model,
-        request.dataset_path,
-        request.hyperparameters,
-    )
+    # Hand the job to a training worker
+    try:
+        _job_queue.put_nowait((
+            job_id,
+            request.base_model,
+            request.dataset_path,
+            request.hyperparameters,
+        ))
+    except asyncio.QueueFull:
+        # Another request filled the queue while the job record was written
+        await _training_jobs.update(job_id, {
+            "status": "failed",
+            "error_message": "Training queue full",
+            **_timestamp_fields(),
+        })
+        _raise_queue_full(x_request_id)
 
     record_training_job(request.base_model, job_id, "started")
 
@@ -149,7 +198,63 @@ async def start_finetune(
         job_id=job_id,
         status="started",
         estimated_duration_minutes=120,
-        created_at=_training_jobs[job_id]["created_at"],
+        created_at=created_at,
+    )
+
+
+def _raise_not_ready(x_request_id: Optional[str]) -> None:
+    """Reject a fine-tuning request because the training workers are not running.
+
+    Args:
+        x_request_id: Request ID header
+
+    Raises:
+        HTTPException: Always, with status 503
+    """
+    logger.warning(
+        "Training workers not started",
+        extra={"request_id": x_request_id},
+    )
+    raise HTTPException(
+        status_code=503,
+        detail={
+            "error": {
+                "code": "SERVICE_UNAVAILABLE",
+                "message": "Training workers are not running",
+                "request_id": x_request_id,
+            }
+        },
+    )
+
+
+def _raise_queue_full(x_request_id: Optional[str]) -> None:
+    """Reject a fine-tuning request because the job queue is full.
+
+    Args:
+        x_request_id: Request ID header
+
+    Raises:
+        HTTPException: Always, with status 429
+    """
+    logger.warning(
+        "Training job queue full",
+        extra={
+            "queued_jobs": _job_queue.qsize(),
+            "request_id": x_request_id,
+        },
+    )
+    raise HTTPException(
+        status_code=429,
+        detail={
+            "error": {
+                "code": "RATE_LIMIT_EXCEEDED",
+                "message": (
+                    f"Maximum concurrent training jobs ({config.MAX_CONCURRENT_TRAINING_JOBS}) "
+                    f"running and {config.TRAINING_QUEUE_MAX_SIZE} queued"
+                ),
+                "request_id": x_request_id,
+            }
+        },
     )
 
 
@@ -167,7 +272,78 @@ async def get_finetune_status(
     Returns:
         Fine-tuning status response
     """
-    if job_id not in _training_jobs:
+    job = await _training_jobs.get(job_id)
+
+    if job is None:
+        logger.warning(
+            "Job not found",
+            extra={"job_id": job_id, "request_id": x_request_id},
+        )
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": f"Job {job_id} not found",
+                    "request_id": x_request_id,
+                }
+            },
+        )
+
+    return _build_status_response(job_id, job)
+
+
+@router.post("/status/batch", response_model=FinetuneStatusBatchResponse)
+async def get_finetune_status_batch(
+    request: FinetuneStatusBatchRequest,
+    x_request_id: Optional[str] = Header(None),
+) -> FinetuneStatusBatchResponse:
+    """Get the status of several fine-tuning jobs in one call.
+
+    Args:
+        request: Job IDs to look up
+        x_request_id: Request ID header
+
+    Returns:
+        Status of each found job, plus the IDs that were not found
+    """
+    jobs = await _training_jobs.get_many(request.job_ids)
+
+    statuses = []
+    not_found = []
+    for job_id, job in zip(request.job_ids, jobs):
+        if job is None:
+            not_found.append(job_id)
+        else:
+            statuses.append(_build_status_response(job_id, job))
+
+    if not_found:
+        logger.warning(
+            "Jobs not found",
+            extra={"job_ids": not_found, "request_id": x_request_id},
+        )
+
+    return FinetuneStatusBatchResponse(jobs=statuses, not_found=not_found)
+
+
+@router.get("/status/stream")
+async def stream_finetune_status(
+    job_id: str,
+    x_request_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """Stream fine-tuning job status as server-sent events.
+
+    An event is sent immediately and then whenever the job changes, until it
+    completes or fails, so clients don't need to poll /status.
+
+    Args:
+        job_id: Job ID
+        x_request_id: Request ID header
+
+    Returns:
+        text/event-stream response of FinetuneStatusResponse payloads
+    """
+    if await _training_jobs.get(job_id) is None:
         logger.warning(
             "Job not found",
             extra={"job_id": job_id, "request_id": x_request_id},
@@ -183,19 +359,63 @@ async def get_finetune_status(
             },
         )
 
-    job = _training_jobs[job_id]
+    return StreamingResponse(
+        _status_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _status_events(job_id: str) -> AsyncIterator[bytes]:
+    """Produce SSE frames for a job until it reaches a terminal state.
+
+    Args:
+        job_id: Job ID
+
+    Yields:
+        Encoded SSE frames
+    """
+    last_payload = None
+
+    async for job in _training_jobs.watch(job_id, keepalive_seconds=STATUS_STREAM_KEEPALIVE_SECONDS):
+        if job is None:
+            # Comment frame keeps proxies from closing an idle stream
+            yield b": keepalive\n\n"
+            continue
+
+        status = _build_status_response(job_id, job)
+        payload = orjson.dumps(status.model_dump())
+
+        # A notification can arrive for a change that was already read
+        if payload != last_payload:
+            yield b"data: " + payload + b"\n\n"
+            last_payload = payload
+
+        if status.status in ("completed", "failed"):
+            break
+
+
+def _build_status_response(job_id: str, job: Dict[str, Any]) -> FinetuneStatusResponse:
+    """Build a status response from stored job state.
 
+    Args:
+        job_id: Job ID
+        job: Stored job state
+
+    Returns:
+        Fine-tuning status response
+    """
     # Calculate elapsed time
-    created_at = datetime.fromisoformat(job["created_at"].replace("Z", "+00:00"))
-    updated_at = datetime.fromisoformat(job["updated_at"].replace("Z", "+00:00"))
-    elapsed = (updated_at - created_at).total_seconds()
+    elapsed = job["_updated_ts"] - job["_created_ts"]
 
     # Calculate estimated remaining time
     estimated_remaining = None
     if job["progress"] > 0 and job["status"] == "running":
         estimated_remaining = (elapsed / job["progress"]) * (1 - job["progress"])
 
-    return FinetuneStatusResponse(
+    # Stored state was written by this module with the right types, so skip
+    # per-field validation on this frequently polled path
+    return FinetuneStatusResponse.model_construct(
         job_id=job_id,
         status=job["status"],
         progress=job["progress"],
@@ -211,6 +431,85 @@ async def get_finetune_status(
     )
 
 
+async def fail_interrupted_jobs() -> int:
+    """Mark jobs left unfinished by a previous process as failed.
+
+    Queued and running jobs only live in the process that accepted them, so
+    any job still started or running at startup was lost with that process.
+    Must run before start_training_workers, while this process owns no jobs.
+
+    Returns:
+        Number of jobs marked as failed
+    """
+    job_ids = [job_id async for job_id in _training_jobs.scan_ids()]
+    jobs = await _training_jobs.get_many(job_ids)
+
+    interrupted = [
+        job_id
+        for job_id, job in zip(job_ids, jobs)
+        if job is not None and job.get("status") in _UNFINISHED_STATUSES
+    ]
+    for job_id in interrupted:
+        await _training_jobs.update(job_id, {
+            "status": "failed",
+            "error_message": "Interrupted by service restart",
+            **_timestamp_fields(),
+        })
+
+    if interrupted:
+        logger.warning(
+            "Marked interrupted training jobs as failed",
+            extra={"job_ids": interrupted},
+        )
+
+    return len(interrupted)
+
+
+def start_training_workers() -> None:
+    """Create the job queue and spawn the training workers.
+
+    Must be called from the running event loop (application startup).
+    """
+    global _job_queue
+
+    _job_queue = asyncio.Queue(maxsize=config.TRAINING_QUEUE_MAX_SIZE)
+    _workers.extend(
+        asyncio.create_task(_training_worker(_job_queue))
+        for _ in range(config.MAX_CONCURRENT_TRAINING_JOBS)
+    )
+
+
+async def stop_training_workers() -> None:
+    """Cancel the training workers."""
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+
+async def _training_worker(queue: asyncio.Queue) -> None:
+    """Run queued fine-tuning jobs one at a time.
+
+    A job that raises (e.g. a Redis error while recording its failure) is
+    logged and the worker moves on; only cancellation ends it.
+
+    Args:
+        queue: Queue of (job_id, base_model, dataset_path, hyperparameters)
+    """
+    while True:
+        job_id, base_model, dataset_path, hyperparameters = await queue.get()
+        try:
+            await _run_finetune_job(job_id, base_model, dataset_path, hyperparameters)
+        except Exception as e:
+            logger.error(
+                "Training worker job failed",
+                extra={"job_id": job_id, "error": str(e)},
+                exc_info=True,
+            )
+        finally:
+            queue.task_done()
+
+
 async def _run_finetune_job(
     job_id: str,
     base_model: str,
@@ -226,8 +525,10 @@ async def _run_finetune_job(
         hyperparameters: Custom hyperparameters
     """
     try:
-        _training_jobs[job_id]["status"] = "running"
-        _training_jobs[job_id]["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        await _training_jobs.update(job_id, {
+            "status": "running",
+            **_timestamp_fields(),
+        })
 
         logger.info("Fine-tuning job running", extra={"job_id": job_id})
 
@@ -238,16 +539,18 @@ async def _run_finetune_job(
             train_dataset_path=dataset_path,
         )
 
+        training_args = training_config.training_args
+
         # Override with custom hyperparameters if provided
         if hyperparameters:
             if "lora_rank" in hyperparameters:
                 training_config.lora.lora_r = hyperparameters["lora_rank"]
             if "learning_rate" in hyperparameters:
-                training_config.training_args.learning_rate = hyperparameters["learning_rate"]
+                training_args.learning_rate = hyperparameters["learning_rate"]
             if "epochs" in hyperparameters:
-                training_config.training_args.num_train_epochs = hyperparameters["epochs"]
+                training_args.num_train_epochs = hyperparameters["epochs"]
             if "batch_size" in hyperparameters:
-                training_config.training_args.per_device_train_batch_size = hyperparameters["batch_size"]
+                training_args.per_device_train_batch_size = hyperparameters["batch_size"]
 
         # Initialize trainer
         trainer = LoRATrainer(training_config)
@@ -264,31 +567,52 @@ async def _run_finetune_job(
         train_dataset = trainer.preprocess_dataset(
             dataset,
             max_seq_length=training_config.data.max_seq_length,
+            packing=training_config.data.packing,
         )
 
-        _training_jobs[job_id]["total_steps"] = (
-            len(train_dataset) // training_config.training_args.per_device_train_batch_size
-        ) * training_config.training_args.num_train_epochs
+        # Training runs on a worker thread; push its progress reports back
+        # onto the event loop as job updates
+        loop = asyncio.get_running_loop()
+        progress_updates: List[concurrent.futures.Future] = []
+
+        def report_progress(fields: Dict[str, Any]) -> None:
+            progress_updates[:] = [update for update in progress_updates if not update.done()]
+            progress_updates.append(asyncio.run_coroutine_threadsafe(
+                _training_jobs.update(job_id, {**fields, **_timestamp_fields()}),
+                loop,
+            ))
 
         # Run training
         logger.info("Starting training", extra={"job_id": job_id})
-        result = await asyncio.to_thread(
-            trainer.train,
-            train_dataset,
-            None,
-            job_id,
-        )
+        try:
+            result = await asyncio.to_thread(
+                trainer.train,
+                train_dataset,
+                None,
+                job_id,
+                report_progress,
+            )
+        finally:
+            # Let in-flight progress writes land before the final status, so a
+            # late one can't overwrite it
+            await asyncio.gather(
+                *(asyncio.wrap_future(update) for update in progress_updates),
+                return_exceptions=True,
+            )
 
         if result["status"] == "completed":
             # Save model
             output_dir = trainer.save_model(f"/tmp/models/{job_id}")
 
-            _training_jobs[job_id]["status"] = "completed"
-            _training_jobs[job_id]["output_path"] = output_dir
-            _training_jobs[job_id]["training_loss"] = result.get("training_loss")
-            _training_jobs[job_id]["eval_loss"] = result.get("eval_loss")
-            _training_jobs[job_id]["progress"] = 1.0
-            _training_jobs[job_id]["steps_completed"] = _training_jobs[job_id]["total_steps"]
+            await _training_jobs.update(job_id, {
+                "status": "completed",
+                "output_path": output_dir,
+                "training_loss": result.get("training_loss"),
+                "eval_loss": result.get("eval_loss"),
+                "progress": 1.0,
+                "steps_completed": result.get("steps_completed"),
+                **_timestamp_fields(),
+            })
 
             logger.info(
                 "Fine-tuning job completed",
@@ -301,8 +625,11 @@ async def _run_finetune_job(
 
             record_training_job(base_model, job_id, "completed")
         else:
-            _training_jobs[job_id]["status"] = "failed"
-            _training_jobs[job_id]["error_message"] = result.get("error", "Unknown error")
+            await _training_jobs.update(job_id, {
+                "status": "failed",
+                "error_message": result.get("error", "Unknown error"),
+                **_timestamp_fields(),
+            })
 
             logger.error(
                 "Fine-tuning job failed",
@@ -315,8 +642,11 @@ async def _run_finetune_job(
             record_training_job(base_model, job_id, "failed")
 
     except Exception as e:
-        _training_jobs[job_id]["status"] = "failed"
-        _training_jobs[job_id]["error_message"] = str(e)
+        await _training_jobs.update(job_id, {
+            "status": "failed",
+            "error_message": str(e),
+            **_timestamp_fields(),
+        })
 
         logger.error(
             "Fine-tuning job exception",
@@ -325,6 +655,3 @@ async def _run_finetune_job(
         )
 
         record_training_job(base_model, job_id, "failed")
-
-    finally:
-        _training_jobs[job_id]["updated_at"] = datetime.utcnow().isoformat() + "Z"
@@ -1,22 +1,74 @@
 """Health check endpoint."""
 
+import asyncio
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 import redis
 from fastapi import APIRouter, Header
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_config
 from app.utils.logging_config import setup_json_logging
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = setup_json_logging("health")
 config = get_config()
 
 # Service startup time for uptime calculation
 _start_time = time.time()
 
+# Dependency check results are reused for this long so frequent probes and
+# scrapes don't hit Redis and S3 on every request
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_dependency_cache: Dict[str, Any] = {"ts": 0.0, "value": None}
+_dependency_lock = asyncio.Lock()
+
+# Dependency clients, created once and reused so each check is a single
+# request over a pooled connection rather than a fresh handshake
+_redis_client: Optional[redis.Redis] = None
+_s3_client: Optional[Any] = None
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client used for health checks.
+
+    Returns:
+        Redis client
+    """
+    global _redis_client
+
+    if _redis_client is None:
+        _redis_client = redis.Redis(
+            host=config.REDIS_HOST,
+            port=config.REDIS_PORT,
+            password=config.REDIS_PASSWORD,
+            ssl=config.REDIS_SSL,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+
+    return _redis_client
+
+
+def _get_s3_client() -> Any:
+    """Get the shared S3 client used for health checks.
+
+    Returns:
+        boto3 S3 client
+    """
+    global _s3_client
+
+    if _s3_client is None:
+        import boto3
+
+        _s3_client = boto3.client("s3", region_name=config.AWS_DEFAULT_REGION)
+
+    return _s3_client
+
 
 def check_gpu_availability() -> Dict[str, Any]:
     """Check GPU availability.
@@ -56,14 +108,7 @@ def check_redis() -> Dict[str, Any]:
     """
     start = time.time()
     try:
-        client = redis.Redis(
-            host=config.REDIS_HOST,
-            port=config.REDIS_PORT,
-            password=config.REDIS_PASSWORD,
-            decode_responses=True,
-            socket_connect_timeout=5,
-        )
-        client.ping()
+        _get_redis_client().ping()
         latency_ms = (time.time() - start) * 1000
         return {
             "status": "healthy",
@@ -86,15 +131,8 @@ def check_s3() -> Dict[str, Any]:
     """
     start = time.time()
     try:
-        import boto3
-        client = boto3.client(
-            "s3",
-            region_name=config.AWS_DEFAULT_REGION,
-            aws_access_key_id=config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
-        )
         # Try to list buckets
-        client.list_buckets()
+        _get_s3_client().list_buckets()
         latency_ms = (time.time() - start) * 1000
         return {
             "status": "healthy",
@@ -109,6 +147,28 @@ def check_s3() -> Dict[str, Any]:
         }
 
 
+async def _check_dependencies() -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Run dependency checks concurrently, reusing recent results.
+
+    Returns:
+        Tuple of (gpu_status, redis_status, s3_status)
+    """
+    async with _dependency_lock:
+        if time.monotonic() - _dependency_cache["ts"] < HEALTH_CACHE_TTL_SECONDS:
+            return _dependency_cache["value"]
+
+        # Each check blocks on I/O, so overlap them on worker threads
+        value = tuple(await asyncio.gather(
+            asyncio.to_thread(check_gpu_availability),
+            asyncio.to_thread(check_redis),
+            asyncio.to_thread(check_s3),
+        ))
+        _dependency_cache["ts"] = time.monotonic()
+        _dependency_cache["value"] = value
+
+        return value
+
+
 @router.get("/health")
 async def health_check(x_request_id: Optional[str] = Header(None)):
     """Get service health status.
@@ -117,9 +177,7 @@ async def health_check(x_request_id: Optional[str] = Header(None)):
         Health status response
     """
     # Check dependencies
-    gpu_status = check_gpu_availability()
-    redis_status = check_redis()
-    s3_status = check_s3()
+    gpu_status, redis_status, s3_status = await _check_dependencies()
 
     # Determine overall status
     critical_deps = [gpu_status, s3_status]  # GPU and S3 are critical
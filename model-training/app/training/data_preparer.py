@@ -1,15 +1,127 @@
 """Data preparation for model training."""
 
-import json
-import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+import orjson
+
+from app.utils.jsonl import (
+    WRITE_BUFFER_BYTES,
+    iter_lines,
+    iter_sampled_lines,
+    write_jsonl,
+    write_jsonl_mapped,
+)
 from app.utils.logging_config import setup_json_logging
 
 
 logger = setup_json_logging("data_preparer")
 
+# Sentence boundary: terminal punctuation followed by whitespace
+_SENT_RE = re.compile(r"[.!?]+\s+")
+
+
+@dataclass(slots=True)
+class InstructionExample:
+    """Instruction-tuning example.
+
+    orjson serializes dataclasses natively, in field order, so examples are
+    written without first being copied into a dict.
+    """
+
+    instruction: str
+    input: str
+    output: str
+    metadata: Dict[str, Any]
+
+
+def _extract_instructions_from_document(document: Dict[str, Any]) -> List[InstructionExample]:
+    """Extract instruction examples from a document.
+
+    Module-level so it can be shipped to process pool workers.
+
+    Args:
+        document: Document with title, content, metadata
+
+    Returns:
+        List of instruction-following examples
+    """
+    instructions: List[InstructionExample] = []
+    content = document.get("content", "")
+    title = document.get("title", "")
+    source_url = document.get("source_url", "")
+
+    if not content:
+        return instructions
+
+    # Split content into paragraphs
+    paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
+
+    for i, paragraph in enumerate(paragraphs[:10]):  # Limit to 10 paragraphs per doc
+        # Tokenize once for both length checks and the key terms
+        words = paragraph.split()
+        if len(words) < 10:
+            continue
+
+        # Create question-answering example
+        instructions.append(
+            InstructionExample(
+                instruction=f"Based on Ministry of Culture information: {title}, answer the following question.",
+                input=f"Question: Provide information about {_extract_key_terms(words)[:50]}",
+                output=paragraph,
+                metadata={
+                    "source": source_url,
+                    "document_title": title,
+                    "paragraph_index": i,
+                },
+            )
+        )
+
+        # Create summarization example
+        if len(words) > 50:
+            instructions.append(
+                InstructionExample(
+                    instruction="Summarize the following Ministry of Culture information.",
+                    input=paragraph,
+                    output=_create_summary(paragraph),
+                    metadata={
+                        "source": source_url,
+                        "document_title": title,
+                        "task": "summarization",
+                    },
+                )
+            )
+
+    return instructions
+
+
+def _extract_key_terms(words: List[str]) -> str:
+    """Extract key terms from tokenized text.
+
+    Args:
+        words: Words of the input text
+
+    Returns:
+        Key terms (first few words)
+    """
+    return " ".join(words[:10])
+
+
+def _create_summary(text: str) -> str:
+    """Create a simple summary by taking first sentences.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Summary
+    """
+    # maxsplit stops scanning once the first three sentences are found
+    sentences = _SENT_RE.split(text, maxsplit=3)[:3]
+    return ". ".join([s.strip().rstrip(".!?") for s in sentences if s.strip()]) + "."
+
 
 class DataPreparer:
     """Prepare and format data for training."""
@@ -27,27 +139,30 @@ class DataPreparer:
         self,
         documents: List[Dict[str, Any]],
         output_file: str = "instruction_dataset.jsonl",
+        max_workers: Optional[int] = None,
     ) -> str:
         """Convert raw documents to instruction-tuning format.
 
+        Large corpora are split across a process pool (see
+        write_jsonl_mapped); examples are written in document order.
+
         Args:
             documents: List of document dicts with 'title', 'content', 'source_url'
             output_file: Output filename
+            max_workers: Worker processes for large corpora (default: CPU count)
 
         Returns:
             Path to saved instruction dataset
         """
         output_path = self.output_dir / output_file
-        instruction_count = 0
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            for doc in documents:
-                # Create instruction-following examples from document content
-                instructions = self._extract_instructions_from_document(doc)
 
-                for instruction in instructions:
-                    f.write(json.dumps(instruction, ensure_ascii=False) + "\n")
-                    instruction_count += 1
+        # Create instruction-following examples from document content
+        instruction_count = write_jsonl_mapped(
+            output_path,
+            documents,
+            _extract_instructions_from_document,
+            max_workers=max_workers,
+        )
 
         logger.info(
             "Converted documents to instruction format",
@@ -60,83 +175,6 @@ class DataPreparer:
 
         return str(output_path)
 
-    def _extract_instructions_from_document(self, document: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Extract instruction examples from a document.
-
-        Args:
-            document: Document with title, content, metadata
-
-        Returns:
-            List of instruction-following examples
-        """
-        instructions = []
-        content = document.get("content", "")
-        title = document.get("title", "")
-        source_url = document.get("source_url", "")
-
-        if not content:
-            return instructions
-
-        # Split content into paragraphs
-        paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
-
-        for i, paragraph in enumerate(paragraphs[:10]):  # Limit to 10 paragraphs per doc
-            if len(paragraph.split()) < 10:
-                continue
-
-            # Create question-answering example
-            example = {
-                "instruction": f"Based on Ministry of Culture information: {title}, answer the following question.",
-                "input": f"Question: Provide information about {self._extract_key_terms(paragraph)[:50]}",
-                "output": paragraph,
-                "metadata": {
-                    "source": source_url,
-                    "document_title": title,
-                    "paragraph_index": i,
-                },
-            }
-            instructions.append(example)
-
-            # Create summarization example
-            if len(paragraph.split()) > 50:
-                summary_example = {
-                    "instruction": "Summarize the following Ministry of Culture information.",
-                    "input": paragraph,
-                    "output": self._create_summary(paragraph),
-                    "metadata": {
-                        "source": source_url,
-                        "document_title": title,
-                        "task": "summarization",
-                    },
-                }
-                instructions.append(summary_example)
-
-        return instructions
-
-    def _extract_key_terms(self, text: str) -> str:
-        """Extract key terms from text.
-
-        Args:
-            text: Input text
-
-        Returns:
-            Key terms (first few words)
-        """
-        words = text.split()[:10]
-        return " ".join(words)
-
-    def _create_summary(self, text: str) -> str:
-        """Create a simple summary by taking first sentences.
-
-        Args:
-            text: Input text
-
-        Returns:
-            Summary
-        """
-        sentences = text.split(".")[:3]
-        return ". ".join([s.strip() for s in sentences if s.strip()]) + "."
-
     def format_qa_pairs(
         self,
         qa_pairs: List[Dict[str, Any]],
@@ -152,11 +190,11 @@ class DataPreparer:
             Path to saved QA dataset
         """
         output_path = self.output_dir / output_file
-        saved_count = 0
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for qa in qa_pairs:
-                formatted_qa = {
+        saved_count = write_jsonl(
+            output_path,
+            (
+                {
                     "instruction": "Answer the following question about Indian Ministry of Culture.",
                     "input": qa.get("question", ""),
                     "output": qa.get("answer", ""),
@@ -166,8 +204,9 @@ class DataPreparer:
                         "confidence": qa.get("confidence", 0.0),
                     },
                 }
-                f.write(json.dumps(formatted_qa, ensure_ascii=False) + "\n")
-                saved_count += 1
+                for qa in qa_pairs
+            ),
+        )
 
         logger.info(
             "Formatted QA pairs for training",
@@ -199,53 +238,69 @@ class DataPreparer:
         """
         input_path = Path(input_file)
 
-        # Read all examples
-        examples = []
-        with open(input_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    examples.append(json.loads(line))
+        # First pass: count examples without parsing them
+        with open(input_path, "rb") as f:
+            total = sum(1 for line in f if line.strip())
 
-        total = len(examples)
         train_size = int(total * train_ratio)
         eval_size = int(total * eval_ratio)
 
-        # Split
-        train_examples = examples[:train_size]
-        eval_examples = examples[train_size : train_size + eval_size]
-        test_examples = examples[train_size + eval_size :]
-
         # Save splits
         train_path = self.output_dir / "train.jsonl"
         eval_path = self.output_dir / "eval.jsonl"
         test_path = self.output_dir / "test.jsonl"
 
-        for path, examples_subset in [
-            (train_path, train_examples),
-            (eval_path, eval_examples),
-            (test_path, test_examples),
-        ]:
-            with open(path, "w", encoding="utf-8") as f:
-                for ex in examples_subset:
-                    f.write(json.dumps(ex, ensure_ascii=False) + "\n")
+        # Second pass: stream each raw line into its split. Lines are only
+        # partitioned, so there is no need to parse and re-serialize them.
+        sizes = [0, 0, 0]
+        with open(input_path, "rb") as f, \
+                open(train_path, "wb", buffering=WRITE_BUFFER_BYTES) as train_f, \
+                open(eval_path, "wb", buffering=WRITE_BUFFER_BYTES) as eval_f, \
+                open(test_path, "wb", buffering=WRITE_BUFFER_BYTES) as test_f:
+            outputs = (train_f, eval_f, test_f)
+            index = 0
+
+            for line in f:
+                if not line.strip():
+                    continue
+
+                if index < train_size:
+                    split = 0
+                elif index < train_size + eval_size:
+                    split = 1
+                else:
+                    split = 2
+
+                outputs[split].write(line if line.endswith(b"\n") else line + b"\n")
+                sizes[split] += 1
+                index += 1
 
         logger.info(
             "Split dataset into train/eval/test",
             extra={
                 "total_examples": total,
-                "train_size": len(train_examples),
-                "eval_size": len(eval_examples),
-                "test_size": len(test_examples),
+                "train_size": sizes[0],
+                "eval_size": sizes[1],
+                "test_size": sizes[2],
             },
         )
 
         return str(train_path), str(eval_path), str(test_path)
 
-    def validate_dataset(self, dataset_path: str) -> bool:
+    def validate_dataset(
+        self,
+        dataset_path: str,
+        sample_size: Optional[int] = None,
+        fail_fast: bool = True,
+    ) -> bool:
         """Validate dataset format and structure.
 
         Args:
             dataset_path: Path to dataset JSONL file
+            sample_size: If set, check only the first sample_size lines plus
+                sample_size randomly chosen lines from the rest of the file
+            fail_fast: Stop at the first invalid line, since the result is
+                already known; set False to log every invalid line
 
         Returns:
             True if valid, False otherwise
@@ -254,31 +309,39 @@ class DataPreparer:
         valid_count = 0
         invalid_count = 0
 
+        if sample_size is None:
+            lines = enumerate(iter_lines(dataset_path), 1)
+        else:
+            lines = iter_sampled_lines(dataset_path, sample_size)
+
         try:
-            with open(dataset_path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    if not line.strip():
-                        continue
-
-                    try:
-                        example = json.loads(line)
-                        if not all(key in example for key in required_keys):
-                            logger.warning(
-                                "Invalid example format",
-                                extra={
-                                    "line_number": line_num,
-                                    "missing_keys": list(required_keys - set(example.keys())),
-                                },
-                            )
-                            invalid_count += 1
-                        else:
-                            valid_count += 1
-                    except json.JSONDecodeError as e:
+            # Raw bytes go straight to orjson; no text-layer decode
+            for line_num, line in lines:
+                if not line.strip():
+                    continue
+
+                try:
+                    example = orjson.loads(line)
+                    if not required_keys.issubset(example.keys()):
                         logger.warning(
-                            "Invalid JSON in dataset",
-                            extra={"line_number": line_num, "error": str(e)},
+                            "Invalid example format",
+                            extra={
+                                "line_number": line_num,
+                                "missing_keys": list(required_keys - set(example.keys())),
+                            },
                         )
                         invalid_count += 1
+                    else:
+                        valid_count += 1
+                except orjson.JSONDecodeError as e:
+                    logger.warning(
+                        "Invalid JSON in dataset",
+                        extra={"line_number": line_num, "error": str(e)},
+                    )
+                    invalid_count += 1
+
+                if fail_fast and invalid_count:
+                    break
 
             logger.info(
                 "Dataset validation complete",
@@ -286,6 +349,7 @@ class DataPreparer:
                     "valid_examples": valid_count,
                     "invalid_examples": invalid_count,
                     "dataset_path": dataset_path,
+                    "sampled": sample_size is not None,
                 },
             )
 
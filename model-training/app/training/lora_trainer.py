@@ -1,20 +1,26 @@
 """QLoRA fine-tuning implementation."""
 
 import os
-import json
+import hashlib
+import importlib.util
+import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import time
 
+import orjson
 import torch
+from torch._dynamo.exc import TorchDynamoException
 from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
+    DataCollatorForSeq2Seq,
     TrainingArguments as HFTrainingArguments,
     Trainer,
+    default_data_collator,
 )
-from datasets import Dataset, load_dataset
-from peft import get_peft_model, LoraConfig, TaskType
+from datasets import Dataset, Features, Sequence, Value, load_dataset
+from peft import get_peft_model, prepare_model_for_kbit_training, LoraConfig, TaskType
 
 from app.training.training_config import TrainingConfig
 from app.utils.logging_config import setup_json_logging
@@ -23,6 +29,105 @@ from app.utils.metrics import record_training_job, record_training_duration
 
 logger = setup_json_logging("lora_trainer")
 
+# Rows per batch handed to the formatting and tokenization map workers
+PREPROCESS_BATCH_SIZE = 1000
+
+# Arrow schema for tokenized rows. Token IDs fit in int32 for any current
+# vocabulary and the mask in int8: half and an eighth of the int64 Arrow
+# infers from Python ints. The collator still builds int64 tensors per batch.
+TOKENIZED_FEATURES = Features({
+    "input_ids": Sequence(Value("int32")),
+    "attention_mask": Sequence(Value("int8")),
+    "labels": Sequence(Value("int32")),
+})
+
+# Bumped whenever the tokenized row layout changes, so cached files written
+# by an older layout are not reused
+TOKENIZED_CACHE_VERSION = 2
+
+# Label value ignored by the loss
+IGNORE_INDEX = -100
+
+
+def _format_examples(examples: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Format a batch of examples for instruction tuning.
+
+    Args:
+        examples: Batch with instruction, input and output columns
+
+    Returns:
+        Batch with a text column
+    """
+    # Format: [INST] instruction input [/INST] output
+    return {
+        "text": [
+            f"[INST] {instruction} {input_text} [/INST] {output_text}"
+            for instruction, input_text, output_text in zip(
+                examples["instruction"], examples["input"], examples["output"]
+            )
+        ],
+    }
+
+
+def _tokenize_examples(
+    examples: Dict[str, List[str]],
+    tokenizer: Any,
+    max_seq_length: int,
+    packing: bool,
+) -> Dict[str, List[List[int]]]:
+    """Tokenize a batch of formatted examples.
+
+    Labels are built here rather than by the collator. The pad token is
+    often the EOS token, and a language-modeling collator would mask every
+    EOS label, so the model would never learn to stop.
+
+    Args:
+        examples: Batch with a text column
+        tokenizer: Fast tokenizer
+        max_seq_length: Maximum sequence length
+        packing: Join EOS-separated examples and cut the stream into
+            max_seq_length blocks instead of truncating each example
+
+    Returns:
+        Batch with input_ids, attention_mask and labels columns
+    """
+    if not packing:
+        # Left unpadded; the collator pads each batch to its longest sequence
+        encoded = tokenizer(
+            examples["text"],
+            padding=False,
+            max_length=max_seq_length,
+            truncation=True,
+        )
+        return {
+            "input_ids": encoded["input_ids"],
+            "attention_mask": encoded["attention_mask"],
+            "labels": [list(input_ids) for input_ids in encoded["input_ids"]],
+        }
+
+    stream = []
+    for input_ids in tokenizer(examples["text"], padding=False, truncation=False)["input_ids"]:
+        stream.extend(input_ids)
+        stream.append(tokenizer.eos_token_id)
+
+    input_blocks = []
+    mask_blocks = []
+    label_blocks = []
+    for start in range(0, len(stream), max_seq_length):
+        block = stream[start:start + max_seq_length]
+        # Pad the batch's last block so every row has the same length and can
+        # be stacked without a padding collator; padding is ignored by the loss
+        padding = max_seq_length - len(block)
+        input_blocks.append(block + [tokenizer.pad_token_id] * padding)
+        mask_blocks.append([1] * len(block) + [0] * padding)
+        label_blocks.append(block + [IGNORE_INDEX] * padding)
+
+    return {
+        "input_ids": input_blocks,
+        "attention_mask": mask_blocks,
+        "labels": label_blocks,
+    }
+
 
 class LoRATrainer:
     """QLoRA fine-tuning trainer for LLMs."""
@@ -35,6 +140,8 @@ class LoRATrainer:
         """
         self.config = config
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # Set by torchrun for each process of a distributed (DDP) run
+        self.local_rank = int(os.environ.get("LOCAL_RANK", -1))
         self.model = None
         self.tokenizer = None
         self.training_state = {
@@ -53,9 +160,21 @@ class LoRATrainer:
         """
         logger.info(
             "Loading model and tokenizer",
-            extra={"model_name": self.config.model_name, "device": self.device},
+            extra={
+                "model_name": self.config.model_name,
+                "device": self.device,
+                "local_rank": self.local_rank,
+            },
         )
 
+        # Under torchrun each process holds a full replica on its own GPU and
+        # the Trainer wraps it in DDP; otherwise shard across visible GPUs
+        if self.local_rank >= 0:
+            torch.cuda.set_device(self.local_rank)
+            device_map: Any = {"": self.local_rank}
+        else:
+            device_map = "auto"
+
         # Load tokenizer
         self.tokenizer = AutoTokenizer.from_pretrained(
             self.config.model_name,
@@ -70,13 +189,23 @@ class LoRATrainer:
         # Load model with 4-bit quantization
         bnb_config = self._get_bnb_config()
 
+        # 4-bit loading is set by quantization_config; bf16 matches the
+        # adapter compute dtype and the bf16 training arguments
         self.model = AutoModelForCausalLM.from_pretrained(
             self.config.model_name,
             quantization_config=bnb_config,
-            device_map="auto",
+            device_map=device_map,
             trust_remote_code=True,
-            torch_dtype=torch.float16,
-            load_in_4bit=True,
+            torch_dtype=torch.bfloat16,
+            attn_implementation=self._get_attn_implementation(),
+        )
+
+        # Cast norms to fp32, make inputs require grads through the frozen
+        # 4-bit trunk and enable non-reentrant activation checkpointing
+        self.model = prepare_model_for_kbit_training(
+            self.model,
+            use_gradient_checkpointing=self.config.training_args.gradient_checkpointing,
+            gradient_checkpointing_kwargs={"use_reentrant": False},
         )
 
         # Setup LoRA
@@ -111,28 +240,56 @@ class LoRATrainer:
         """
         from transformers import BitsAndBytesConfig
 
+        bnb = self.config.bnb
+        if bnb.bnb_4bit_quant_type != "nf4" or not bnb.bnb_4bit_use_double_quant:
+            logger.warning(
+                "Non-default 4-bit quantization; QLoRA expects NF4 with double quantization",
+                extra={
+                    "bnb_4bit_quant_type": bnb.bnb_4bit_quant_type,
+                    "bnb_4bit_use_double_quant": bnb.bnb_4bit_use_double_quant,
+                },
+            )
+
+        logger.info(
+            "Resolved 4-bit quantization config",
+            extra={
+                "load_in_4bit": bnb.load_in_4bit,
+                "bnb_4bit_quant_type": bnb.bnb_4bit_quant_type,
+                "bnb_4bit_use_double_quant": bnb.bnb_4bit_use_double_quant,
+                "bnb_4bit_compute_dtype": bnb.bnb_4bit_compute_dtype,
+            },
+        )
+
         return BitsAndBytesConfig(
-            load_in_4bit=self.config.bnb.load_in_4bit,
-            bnb_4bit_quant_type=self.config.bnb.bnb_4bit_quant_type,
-            bnb_4bit_use_double_quant=self.config.bnb.bnb_4bit_use_double_quant,
-            bnb_4bit_compute_dtype=torch.float16,
+            load_in_4bit=bnb.load_in_4bit,
+            bnb_4bit_quant_type=bnb.bnb_4bit_quant_type,
+            bnb_4bit_use_double_quant=bnb.bnb_4bit_use_double_quant,
+            bnb_4bit_compute_dtype=getattr(torch, bnb.bnb_4bit_compute_dtype),
         )
 
+    def _get_attn_implementation(self) -> Optional[str]:
+        """Pick the attention kernel for model loading.
+
+        FlashAttention-2 avoids materializing the full attention matrix but
+        needs the flash-attn package and a CUDA device. Otherwise transformers
+        picks the kernel: SDPA where the architecture supports it, eager
+        attention elsewhere (requesting "sdpa" explicitly raises on
+        unsupported architectures).
+
+        Returns:
+            Value for the attn_implementation argument (None: library default)
+        """
+        if self.device == "cuda" and importlib.util.find_spec("flash_attn") is not None:
+            return "flash_attention_2"
+        return None
+
     def _count_trainable_params(self) -> int:
         """Count trainable parameters.
 
         Returns:
             Number of trainable parameters
         """
-        trainable_params = 0
-        all_params = 0
-
-        for _, param in self.model.named_parameters():
-            all_params += param.numel()
-            if param.requires_grad:
-                trainable_params += param.numel()
-
-        return trainable_params
+        return sum(param.numel() for param in self.model.parameters() if param.requires_grad)
 
     def load_dataset(self, dataset_path: str) -> Dataset:
         """Load training dataset from JSONL file.
@@ -145,15 +302,14 @@ class LoRATrainer:
         """
         logger.info("Loading dataset", extra={"dataset_path": dataset_path})
 
-        # Load from JSONL
-        examples = []
-        with open(dataset_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    examples.append(json.loads(line))
-
-        # Convert to Dataset
-        dataset = Dataset.from_list(examples)
+        # PyArrow's JSON reader parses straight into an Arrow table that is
+        # cached on disk and memory-mapped, rather than a list of dicts
+        dataset = load_dataset(
+            "json",
+            data_files=dataset_path,
+            split="train",
+            keep_in_memory=False,
+        )
 
         logger.info(
             "Dataset loaded",
@@ -166,60 +322,70 @@ class LoRATrainer:
         self,
         dataset: Dataset,
         max_seq_length: int = 2048,
+        packing: bool = True,
     ) -> Dataset:
         """Preprocess dataset for training.
 
         Args:
             dataset: Input dataset
             max_seq_length: Maximum sequence length
+            packing: Concatenate EOS-separated examples into max_seq_length
+                blocks instead of keeping one example per sequence
 
         Returns:
             Preprocessed dataset
         """
-        logger.info("Preprocessing dataset", extra={"original_size": len(dataset)})
-
-        def formatting_func(examples):
-            """Format examples for instruction tuning."""
-            output_texts = []
-            for instruction, input_text, output_text in zip(
-                examples.get("instruction", []),
-                examples.get("input", []),
-                examples.get("output", []),
-            ):
-                # Format: [INST] instruction input [/INST] output
-                text = f"[INST] {instruction} {input_text} [/INST] {output_text}"
-                output_texts.append(text)
+        num_proc = self.config.data.preprocessing_num_workers
+        logger.info(
+            "Preprocessing dataset",
+            extra={"original_size": len(dataset), "num_proc": num_proc},
+        )
 
-            return {
-                "text": output_texts,
-                "instruction": examples.get("instruction", []),
-                "input": examples.get("input", []),
-                "output": examples.get("output", []),
-            }
+        # The source fingerprint changes with the data files, so together with
+        # the model and tokenization settings it keys a reusable cache file
+        tokenized_cache_file = None
+        cache_dir = self.config.data.dataset_cache_dir
+        if cache_dir:
+            cache_key = hashlib.sha256(
+                f"{TOKENIZED_CACHE_VERSION}:{self.config.model_name}:{max_seq_length}:{packing}:"
+                f"{dataset._fingerprint}".encode("utf-8")
+            ).hexdigest()[:16]
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            tokenized_cache_file = str(Path(cache_dir) / f"tokenized-{cache_key}.arrow")
 
         # Apply formatting
-        dataset = dataset.map(formatting_func, batched=True, remove_columns=dataset.column_names)
-
-        # Tokenize
-        def tokenize_function(examples):
-            tokenized = self.tokenizer(
-                examples["text"],
-                padding="max_length",
-                max_length=max_seq_length,
-                truncation=True,
-                return_tensors=None,
-            )
-            tokenized["labels"] = tokenized["input_ids"].copy()
-            return tokenized
+        dataset = dataset.map(
+            _format_examples,
+            batched=True,
+            batch_size=PREPROCESS_BATCH_SIZE,
+            num_proc=num_proc,
+            load_from_cache_file=True,
+            remove_columns=dataset.column_names,
+        )
 
+        # Tokenize. Module-level function plus fn_kwargs: workers get only the
+        # (picklable) fast tokenizer, and the cache key doesn't depend on self.
         dataset = dataset.map(
-            tokenize_function,
+            _tokenize_examples,
             batched=True,
+            batch_size=PREPROCESS_BATCH_SIZE,
+            num_proc=num_proc,
+            fn_kwargs={
+                "tokenizer": self.tokenizer,
+                "max_seq_length": max_seq_length,
+                "packing": packing,
+            },
+            load_from_cache_file=True,
+            cache_file_name=tokenized_cache_file,
             remove_columns=dataset.column_names,
+            features=TOKENIZED_FEATURES,
             desc="Tokenizing dataset",
         )
 
-        logger.info("Dataset preprocessing complete", extra={"processed_size": len(dataset)})
+        logger.info(
+            "Dataset preprocessing complete",
+            extra={"processed_size": len(dataset), "packing": packing},
+        )
 
         return dataset
 
@@ -228,6 +394,7 @@ class LoRATrainer:
         train_dataset: Dataset,
         eval_dataset: Optional[Dataset] = None,
         job_id: str = "training_job",
+        progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """Run QLoRA fine-tuning.
 
@@ -235,6 +402,8 @@ class LoRATrainer:
             train_dataset: Training dataset
             eval_dataset: Evaluation dataset (optional)
             job_id: Job ID for tracking
+            progress_hook: Called from the training thread with progress fields
+                (progress, steps_completed, total_steps, training_loss, eval_loss)
 
         Returns:
             Training results dictionary
@@ -250,33 +419,74 @@ class LoRATrainer:
                 "eval_size": len(eval_dataset) if eval_dataset else 0,
                 "epochs": self.config.training_args.num_train_epochs,
                 "batch_size": self.config.training_args.per_device_train_batch_size,
+                "optim": self.config.training_args.optim,
             },
         )
 
         # Record job start
         record_training_job(self.config.model_name, job_id, "started")
 
-        # Prepare training arguments
-        training_args = HFTrainingArguments(
-            **self.config.training_args.to_dict(),
-            run_name=job_id,
-        )
+        def build_trainer(torch_compile: bool) -> Trainer:
+            # Checkpointing is already enabled on the model (non-reentrant);
+            # letting the Trainer enable it again would switch it to reentrant.
+            # Packed rows are all max_seq_length long, so length grouping
+            # would only cost a pass over the dataset to measure them.
+            training_args = HFTrainingArguments(
+                **{
+                    **self.config.training_args.to_dict(),
+                    "gradient_checkpointing": False,
+                    "torch_compile": torch_compile,
+                    "group_by_length": (
+                        self.config.training_args.group_by_length and not self.config.data.packing
+                    ),
+                },
+                run_name=job_id,
+            )
 
-        # Create trainer
-        trainer = Trainer(
-            model=self.model,
-            args=training_args,
-            train_dataset=train_dataset,
-            eval_dataset=eval_dataset,
-            tokenizer=self.tokenizer,
-            callbacks=[
-                self._get_progress_callback(job_id),
-            ],
-        )
+            return Trainer(
+                model=self.model,
+                args=training_args,
+                train_dataset=train_dataset,
+                eval_dataset=eval_dataset,
+                tokenizer=self.tokenizer,
+                data_collator=data_collator,
+                callbacks=[
+                    self._get_progress_callback(job_id, progress_hook),
+                ],
+            )
+
+        # Packed blocks all have max_seq_length tokens and already carry
+        # labels. Unpacked examples are padded per batch (multiples of 8 keep
+        # tensor-core friendly shapes), with padded labels set to IGNORE_INDEX
+        # so EOS labels survive even when the pad token is EOS.
+        if self.config.data.packing:
+            data_collator = default_data_collator
+        else:
+            data_collator = DataCollatorForSeq2Seq(
+                self.tokenizer,
+                pad_to_multiple_of=8,
+                label_pad_token_id=IGNORE_INDEX,
+            )
+
+        torch_compile = self.config.training_args.torch_compile
+        trainer = build_trainer(torch_compile)
 
         # Run training
         try:
-            result = trainer.train()
+            try:
+                result = trainer.train()
+            except TorchDynamoException as e:
+                # Restarting is only safe before the first optimizer step; a
+                # later failure (e.g. a recompile on a new shape) would rerun
+                # training on already-updated LoRA weights, so fail the job
+                if not torch_compile or trainer.state.global_step > 0:
+                    raise
+                logger.warning(
+                    "torch.compile failed, retrying without compilation",
+                    extra={"job_id": job_id, "error": str(e)},
+                )
+                trainer = build_trainer(torch_compile=False)
+                result = trainer.train()
 
             duration = time.time() - start_time
             record_training_duration(self.config.model_name, duration)
@@ -297,6 +507,7 @@ class LoRATrainer:
                 "status": "completed",
                 "job_id": job_id,
                 "duration_seconds": duration,
+                "steps_completed": result.global_step,
                 "training_loss": result.training_loss,
                 "eval_loss": getattr(result, "eval_loss", None),
             }
@@ -322,11 +533,19 @@ class LoRATrainer:
                 "duration_seconds": duration,
             }
 
-    def _get_progress_callback(self, job_id: str):
+    def _get_progress_callback(
+        self,
+        job_id: str,
+        progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
         """Get training progress callback.
 
+        Progress is taken from the trainer state (global_step / max_steps), so
+        the dataset length never has to be known up front.
+
         Args:
             job_id: Job ID for logging
+            progress_hook: Optional receiver for progress fields
 
         Returns:
             Progress callback
@@ -337,8 +556,11 @@ class LoRATrainer:
             def __init__(self, job_id: str):
                 self.job_id = job_id
 
+            def on_train_begin(self, args, state, control, **kwargs):
+                self._report(state)
+
             def on_log(self, args, state, control, logs=None, **kwargs):
-                if logs:
+                if logs and logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         "Training progress",
                         extra={
@@ -348,6 +570,31 @@ class LoRATrainer:
                             "eval_loss": logs.get("eval_loss"),
                         },
                     )
+                self._report(state, logs)
+
+            def _report(self, state, logs: Optional[Dict[str, float]] = None) -> None:
+                if progress_hook is None:
+                    return
+
+                max_steps = state.max_steps or 0
+                fields: Dict[str, Any] = {
+                    "progress": state.global_step / max(max_steps, 1),
+                    "steps_completed": state.global_step,
+                    "total_steps": max_steps,
+                }
+                if logs:
+                    if "loss" in logs:
+                        fields["training_loss"] = logs["loss"]
+                    if "eval_loss" in logs:
+                        fields["eval_loss"] = logs["eval_loss"]
+
+                try:
+                    progress_hook(fields)
+                except Exception as e:
+                    logger.warning(
+                        "Progress hook failed",
+                        extra={"job_id": self.job_id, "error": str(e)},
+                    )
 
         return ProgressCallback(job_id)
 
@@ -360,9 +607,14 @@ class LoRATrainer:
         Returns:
             Path to saved model
         """
+        output_path = Path(output_dir)
+
+        # In a distributed run every replica is identical; only rank 0 writes
+        if self.local_rank > 0:
+            return str(output_path)
+
         logger.info("Saving model", extra={"output_dir": output_dir})
 
-        output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Save LoRA adapter
@@ -373,8 +625,8 @@ class LoRATrainer:
 
         # Save config
         config_dict = self.config.to_dict()
-        with open(output_path / "training_config.json", "w") as f:
-            json.dump(config_dict, f, indent=2)
+        with open(output_path / "training_config.json", "wb") as f:
+            f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
 
         logger.info("Model saved successfully", extra={"output_dir": output_dir})
 
@@ -1,12 +1,14 @@
 """Model merger to combine LoRA adapters with base models."""
 
+import itertools
 import json
 import os
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import AutoConfig, AutoModelForCausalLM, AutoTokenizer
 from peft import PeftModel
 
 from app.utils.logging_config import setup_json_logging
@@ -22,6 +24,29 @@ class ModelMerger:
         """Initialize model merger."""
         pass
 
+    def _load_base_model(self, base_model_name: str) -> Any:
+        """Load the base model in full bf16 precision for merging.
+
+        Merging into a 4-bit model would fold the adapter into dequantized,
+        lossy weights; the merged model is the deployed artifact, so it is
+        built from the unquantized base. The model is loaded entirely on CPU:
+        with device_map="auto", offloaded layers hold meta tensors that
+        merge_and_unload cannot fold the adapter into (peft 0.7).
+
+        Args:
+            base_model_name: Name or path of base model
+
+        Returns:
+            Base model
+        """
+        return AutoModelForCausalLM.from_pretrained(
+            base_model_name,
+            torch_dtype=torch.bfloat16,
+            device_map="cpu",
+            low_cpu_mem_usage=True,
+            trust_remote_code=True,
+        )
+
     def merge_lora_adapter(
         self,
         base_model_name: str,
@@ -52,13 +77,7 @@ class ModelMerger:
         try:
             # Load base model
             logger.info("Loading base model", extra={"model": base_model_name})
-            base_model = AutoModelForCausalLM.from_pretrained(
-                base_model_name,
-                torch_dtype=torch.float16,
-                device_map="auto",
-                trust_remote_code=True,
-                load_in_4bit=True,
-            )
+            base_model = self._load_base_model(base_model_name)
 
             # Load LoRA adapter
             logger.info("Loading LoRA adapter", extra={"adapter_path": adapter_path})
@@ -136,28 +155,32 @@ class ModelMerger:
 
         try:
             # Load base model
-            base_model = AutoModelForCausalLM.from_pretrained(
-                base_model_name,
-                torch_dtype=torch.float16,
-                device_map="auto",
-                trust_remote_code=True,
-                load_in_4bit=True,
-            )
+            base_model = self._load_base_model(base_model_name)
 
-            # Load all adapters and merge
-            model = base_model
-            for i, adapter_path in enumerate(adapter_paths):
+            # Load every adapter onto the same base, combine them into one
+            # weighted adapter, then merge once into the dense weights
+            adapter_names = [f"adapter_{i}" for i in range(len(adapter_paths))]
+            model = None
+            for i, (adapter_name, adapter_path) in enumerate(zip(adapter_names, adapter_paths)):
                 logger.info(
                     f"Loading adapter {i + 1}/{len(adapter_paths)}",
                     extra={"adapter_path": adapter_path},
                 )
-                model = PeftModel.from_pretrained(model, adapter_path)
-
-                if i < len(adapter_paths) - 1:
-                    # Merge intermediate adapters
-                    model = model.merge_and_unload()
+                if model is None:
+                    model = PeftModel.from_pretrained(base_model, adapter_path, adapter_name=adapter_name)
+                else:
+                    model.load_adapter(adapter_path, adapter_name=adapter_name)
+
+            # "cat" stacks the low-rank factors, so the combined update is
+            # exactly sum(w_i * B_i A_i) and adapters may differ in rank
+            model.add_weighted_adapter(
+                adapters=adapter_names,
+                weights=weights,
+                adapter_name="combined",
+                combination_type="cat",
+            )
+            model.set_adapter("combined")
 
-            # Final merge
             merged_model = model.merge_and_unload()
 
             # Load tokenizer
@@ -212,7 +235,6 @@ class ModelMerger:
 
         try:
             from safetensors.torch import save_file
-            import glob
 
             model_dir = Path(model_path) / "model"
 
@@ -221,21 +243,26 @@ class ModelMerger:
             output_dir.mkdir(parents=True, exist_ok=True)
 
             # Convert pytorch_model.bin to safetensors
-            pytorch_files = glob.glob(str(model_dir / "*.bin"))
-            for pytorch_file in pytorch_files:
-                model = torch.load(pytorch_file)
-                safetensors_file = output_dir / pytorch_file.replace(".bin", ".safetensors")
-                save_file(model, str(safetensors_file))
+            for pytorch_file in model_dir.glob("*.bin"):
+                # Map the shard instead of reading it into RAM; save_file pages
+                # tensors in as it writes them. One shard is open at a time.
+                state_dict = torch.load(
+                    pytorch_file,
+                    map_location="cpu",
+                    mmap=True,
+                    weights_only=True,
+                )
+                safetensors_file = output_dir / pytorch_file.with_suffix(".safetensors").name
+                save_file(state_dict, str(safetensors_file), metadata={"format": "pt"})
+                del state_dict
                 logger.info(
                     "Converted model file",
-                    extra={"input": pytorch_file, "output": str(safetensors_file)},
+                    extra={"input": str(pytorch_file), "output": str(safetensors_file)},
                 )
 
             # Copy other files
-            for ext in ["*.json", "*.txt"]:
-                for file in model_dir.glob(ext):
-                    import shutil
-                    shutil.copy(str(file), str(output_dir / file.name))
+            for file in itertools.chain(model_dir.glob("*.json"), model_dir.glob("*.txt")):
+                shutil.copy(str(file), str(output_dir / file.name))
 
             logger.info("Model conversion to safetensors completed")
 
@@ -249,16 +276,22 @@ class ModelMerger:
             )
             raise
 
-    def validate_merged_model(self, model_path: str) -> bool:
+    def validate_merged_model(self, model_path: str, deep: bool = False) -> bool:
         """Validate merged model integrity.
 
+        By default this is a structural check: the config is loaded, the
+        architecture is instantiated on the meta device (no weight memory)
+        and its parameter names are compared with the tensor names in the
+        safetensors shard headers, without reading any weights.
+
         Args:
             model_path: Path to merged model
+            deep: Also load the full model and tokenizer on CPU
 
         Returns:
             True if valid, False otherwise
         """
-        logger.info("Validating merged model", extra={"model_path": model_path})
+        logger.info("Validating merged model", extra={"model_path": model_path, "deep": deep})
 
         try:
             model_dir = Path(model_path)
@@ -278,28 +311,31 @@ class ModelMerger:
                     )
                     return False
 
-            # Try loading model
-            try:
-                model = AutoModelForCausalLM.from_pretrained(
-                    str(model_dir / "model"),
-                    device_map="cpu",
-                    trust_remote_code=True,
-                )
-                tokenizer = AutoTokenizer.from_pretrained(str(model_dir / "tokenizer"))
+            if not self._check_safetensors_structure(model_dir / "model"):
+                return False
 
-                logger.info(
-                    "Model validation successful",
-                    extra={"model_path": model_path},
-                )
-                return True
+            if deep:
+                # Try loading model
+                try:
+                    AutoModelForCausalLM.from_pretrained(
+                        str(model_dir / "model"),
+                        device_map="cpu",
+                        trust_remote_code=True,
+                    )
+                    AutoTokenizer.from_pretrained(str(model_dir / "tokenizer"))
+                except Exception as e:
+                    logger.error(
+                        "Failed to load merged model",
+                        extra={"error": str(e)},
+                        exc_info=True,
+                    )
+                    return False
 
-            except Exception as e:
-                logger.error(
-                    "Failed to load merged model",
-                    extra={"error": str(e)},
-                    exc_info=True,
-                )
-                return False
+            logger.info(
+                "Model validation successful",
+                extra={"model_path": model_path, "deep": deep},
+            )
+            return True
 
         except Exception as e:
             logger.error(
@@ -308,3 +344,60 @@ class ModelMerger:
                 exc_info=True,
             )
             return False
+
+    def _check_safetensors_structure(self, model_dir: Path) -> bool:
+        """Compare saved tensor names with the names the architecture expects.
+
+        Only the safetensors headers are read.
+
+        Args:
+            model_dir: Directory with config.json and *.safetensors shards
+
+        Returns:
+            True if every expected tensor is present and none are unexpected
+        """
+        from safetensors import safe_open
+
+        shard_files = sorted(model_dir.glob("*.safetensors"))
+        if not shard_files:
+            logger.error("No safetensors shards found", extra={"model_dir": str(model_dir)})
+            return False
+
+        saved_keys = set()
+        dtypes = set()
+        for shard_file in shard_files:
+            with safe_open(str(shard_file), framework="pt") as f:
+                for key in f.keys():
+                    saved_keys.add(key)
+                    dtypes.add(f.get_slice(key).get_dtype())
+
+        config = AutoConfig.from_pretrained(str(model_dir), trust_remote_code=True)
+        with torch.device("meta"):
+            meta_model = AutoModelForCausalLM.from_config(config, trust_remote_code=True)
+
+        expected_keys = set(meta_model.state_dict().keys())
+        # Tied weights (e.g. lm_head sharing the embeddings) are saved once
+        tied_keys = set(getattr(meta_model, "_tied_weights_keys", None) or [])
+
+        missing = sorted(expected_keys - saved_keys - tied_keys)
+        unexpected = sorted(saved_keys - expected_keys)
+        if missing or unexpected:
+            logger.error(
+                "Merged model tensors don't match its architecture",
+                extra={
+                    "architecture": (config.architectures or ["unknown"])[0],
+                    "missing_keys": missing[:20],
+                    "unexpected_keys": unexpected[:20],
+                },
+            )
+            return False
+
+        logger.info(
+            "Merged model structure matches config",
+            extra={
+                "architecture": (config.architectures or ["unknown"])[0],
+                "tensor_count": len(saved_keys),
+                "dtypes": sorted(dtypes),
+            },
+        )
+        return True
@@ -1,14 +1,47 @@
 """Generate QA pairs from Ministry content using self-instruct."""
 
-import json
+import re
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
+from app.utils.jsonl import write_jsonl, write_jsonl_mapped
 from app.utils.logging_config import setup_json_logging
 
 
 logger = setup_json_logging("qa_dataset_builder")
 
+# Read/write size for byte-level dataset merges
+MERGE_CHUNK_BYTES = 1 << 20
+
+# QA pairs kept per document
+MAX_QA_PAIRS_PER_DOC = 10
+
+# Documents with fewer words than this yield no QA pairs
+MIN_DOC_WORDS = 20
+
+# Sentence text: a run of characters between periods and line breaks
+_SENTENCE_RE = re.compile(r"[^.\n]+")
+
+# A word: a run of non-whitespace characters, as str.split() sees it
+_WORD_RE = re.compile(r"\S+")
+
+
+def _has_min_words(text: str, min_words: int = MIN_DOC_WORDS) -> bool:
+    """Check whether text has at least min_words words.
+
+    Stops scanning at the min_words-th word instead of splitting the whole
+    document.
+
+    Args:
+        text: Input text
+        min_words: Required word count
+
+    Returns:
+        True if text has at least min_words words
+    """
+    return sum(1 for _ in islice(_WORD_RE.finditer(text), min_words)) >= min_words
+
 
 class QADatasetBuilder:
     """Build QA pairs from Ministry of Culture documents using self-instruct approach."""
@@ -27,28 +60,30 @@ class QADatasetBuilder:
         documents: List[Dict[str, Any]],
         output_file: str = "ministry_qa_pairs.jsonl",
         min_qa_pairs_per_doc: int = 2,
+        max_workers: Optional[int] = None,
     ) -> Tuple[str, int]:
         """Generate QA pairs from documents.
 
+        Large corpora are split across a process pool (see
+        write_jsonl_mapped); pairs are written in document order.
+
         Args:
             documents: List of document dicts
             output_file: Output filename
             min_qa_pairs_per_doc: Minimum QA pairs to generate per document
+            max_workers: Worker processes for large corpora (default: CPU count)
 
         Returns:
             Tuple of (output_path, total_qa_pairs_generated)
         """
         output_path = self.output_dir / output_file
-        total_qa_pairs = 0
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            for doc in documents:
-                qa_pairs = self._generate_qa_from_single_doc(doc)
-                qa_pairs = qa_pairs[:10]  # Limit per document
 
-                for qa in qa_pairs:
-                    f.write(json.dumps(qa, ensure_ascii=False) + "\n")
-                    total_qa_pairs += 1
+        total_qa_pairs = write_jsonl_mapped(
+            output_path,
+            documents,
+            self._generate_qa_from_single_doc,
+            max_workers=max_workers,
+        )
 
         logger.info(
             "Generated QA pairs from documents",
@@ -68,7 +103,7 @@ class QADatasetBuilder:
             document: Document dict with title, content, metadata
 
         Returns:
-            List of QA pair dicts
+            List of QA pair dicts, at most MAX_QA_PAIRS_PER_DOC
         """
         qa_pairs = []
         content = document.get("content", "")
@@ -77,18 +112,23 @@ class QADatasetBuilder:
         language = document.get("language", "hi")
         source_site = document.get("source_site", "")
 
-        if not content or len(content.split()) < 20:
+        if not _has_min_words(content):
             return qa_pairs
 
-        # Split into sentences
+        # Split into sentences; all of them, since definition QA searches the
+        # whole document for each topic
         sentences = self._split_into_sentences(content)
 
         # Generate different types of QA pairs
-        qa_pairs.extend(self._generate_factual_qa(sentences, document))
-        qa_pairs.extend(self._generate_definition_qa(sentences, document))
-        qa_pairs.extend(self._generate_summary_qa(sentences, document))
+        qa_pairs.extend(self._generate_factual_qa(sentences, title, source_url, language, source_site))
+        qa_pairs.extend(
+            self._generate_definition_qa(
+                sentences, [s.lower() for s in sentences], title, source_url, language, source_site
+            )
+        )
+        qa_pairs.extend(self._generate_summary_qa(sentences, title, source_url, language, source_site))
 
-        return qa_pairs
+        return qa_pairs[:MAX_QA_PAIRS_PER_DOC]
 
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences.
@@ -99,37 +139,62 @@ class QADatasetBuilder:
         Returns:
             List of sentences
         """
-        # Simple sentence splitter (can be enhanced with NLTK)
-        sentences = []
-        for line in text.split("\n"):
-            for sentence in line.split("."):
-                sentence = sentence.strip()
-                if sentence and len(sentence.split()) > 5:
-                    sentences.append(sentence + ".")
+        return list(self._iter_sentences(text))
+
+    def _iter_sentences(self, text: str) -> Iterator[str]:
+        """Split text into sentences lazily.
 
-        return sentences
+        The text is scanned only as far as the caller consumes, so callers
+        that need the first few sentences of a long document stop early.
+
+        Args:
+            text: Input text
+
+        Yields:
+            Sentences
+        """
+        # Simple sentence splitter (can be enhanced with NLTK); one regex pass
+        # over lines and periods instead of nested str.split loops
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            if len(sentence.split()) > 5:
+                yield sentence + "."
 
     def _generate_factual_qa(
         self,
         sentences: List[str],
-        document: Dict[str, Any],
+        title: str,
+        source_url: str,
+        language: str,
+        source_site: str,
     ) -> List[Dict[str, Any]]:
         """Generate factual QA pairs.
 
         Args:
             sentences: List of sentences
-            document: Document metadata
+            title: Document title
+            source_url: Document source URL
+            language: Document language
+            source_site: Document source site
 
         Returns:
             List of QA pairs
         """
         qa_pairs = []
-        title = document.get("title", "")
-        source_url = document.get("source_url", "")
-        language = document.get("language", "hi")
-        source_site = document.get("source_site", "")
 
-        for i, sentence in enumerate(sentences[:5]):
+        # Fields shared by every pair from this document; each pair is a copy
+        # with question and answer filled in (key order is kept)
+        template = {
+            "question": "",
+            "answer": "",
+            "language": language,
+            "source_site": source_site,
+            "source_url": source_url,
+            "qa_type": "factual",
+            "confidence": 0.8,
+        }
+
+        for sentence in sentences[:5]:
             # Extract key entities (simple extraction)
             words = sentence.split()
             if len(words) < 10:
@@ -137,15 +202,9 @@ class QADatasetBuilder:
 
             # Create factual question
             key_phrase = " ".join(words[:5])
-            qa_pair = {
-                "question": f"What is mentioned about {key_phrase} in {title}?",
-                "answer": sentence,
-                "language": language,
-                "source_site": source_site,
-                "source_url": source_url,
-                "qa_type": "factual",
-                "confidence": 0.8,
-            }
+            qa_pair = template.copy()
+            qa_pair["question"] = f"What is mentioned about {key_phrase} in {title}?"
+            qa_pair["answer"] = sentence
             qa_pairs.append(qa_pair)
 
         return qa_pairs
@@ -153,38 +212,46 @@ class QADatasetBuilder:
     def _generate_definition_qa(
         self,
         sentences: List[str],
-        document: Dict[str, Any],
+        sentences_lower: List[str],
+        title: str,
+        source_url: str,
+        language: str,
+        source_site: str,
     ) -> List[Dict[str, Any]]:
         """Generate definition QA pairs.
 
         Args:
             sentences: List of sentences
-            document: Document metadata
+            sentences_lower: Lowercased sentences, shared by all topic lookups
+            title: Document title
+            source_url: Document source URL
+            language: Document language
+            source_site: Document source site
 
         Returns:
             List of QA pairs
         """
         qa_pairs = []
-        title = document.get("title", "")
-        source_url = document.get("source_url", "")
-        language = document.get("language", "hi")
-        source_site = document.get("source_site", "")
 
         # Generate definition questions for key topics
         key_topics = self._extract_key_topics(title)
 
+        template = {
+            "question": "",
+            "answer": "",
+            "language": language,
+            "source_site": source_site,
+            "source_url": source_url,
+            "qa_type": "definition",
+            "confidence": 0.75,
+        }
+
         for topic in key_topics[:3]:
-            relevant_sentence = self._find_relevant_sentence(sentences, topic)
+            relevant_sentence = self._find_relevant_sentence(sentences, sentences_lower, topic)
             if relevant_sentence:
-                qa_pair = {
-                    "question": f"Define or explain {topic} in the context of {title}.",
-                    "answer": relevant_sentence,
-                    "language": language,
-                    "source_site": source_site,
-                    "source_url": source_url,
-                    "qa_type": "definition",
-                    "confidence": 0.75,
-                }
+                qa_pair = template.copy()
+                qa_pair["question"] = f"Define or explain {topic} in the context of {title}."
+                qa_pair["answer"] = relevant_sentence
                 qa_pairs.append(qa_pair)
 
         return qa_pairs
@@ -192,22 +259,24 @@ class QADatasetBuilder:
     def _generate_summary_qa(
         self,
         sentences: List[str],
-        document: Dict[str, Any],
+        title: str,
+        source_url: str,
+        language: str,
+        source_site: str,
     ) -> List[Dict[str, Any]]:
         """Generate summary QA pairs.
 
         Args:
             sentences: List of sentences
-            document: Document metadata
+            title: Document title
+            source_url: Document source URL
+            language: Document language
+            source_site: Document source site
 
         Returns:
             List of QA pairs
         """
         qa_pairs = []
-        title = document.get("title", "")
-        source_url = document.get("source_url", "")
-        language = document.get("language", "hi")
-        source_site = document.get("source_site", "")
 
         if len(sentences) > 0:
             # Create summary from first few sentences
@@ -239,19 +308,25 @@ class QADatasetBuilder:
         words = title.split()
         return [" ".join(words[i : i + 2]) for i in range(0, len(words) - 1, 2)][:5]
 
-    def _find_relevant_sentence(self, sentences: List[str], topic: str) -> Optional[str]:
+    def _find_relevant_sentence(
+        self,
+        sentences: List[str],
+        sentences_lower: List[str],
+        topic: str,
+    ) -> Optional[str]:
         """Find sentence relevant to topic.
 
         Args:
             sentences: List of sentences
+            sentences_lower: Lowercased sentences, in the same order
             topic: Topic to find
 
         Returns:
             Relevant sentence or None
         """
         topic_lower = topic.lower()
-        for sentence in sentences:
-            if topic_lower in sentence.lower():
+        for sentence, sentence_lower in zip(sentences, sentences_lower):
+            if topic_lower in sentence_lower:
                 return sentence
 
         return sentences[0] if sentences else None
@@ -271,36 +346,10 @@ class QADatasetBuilder:
             Tuple of (output_path, total_qa_pairs_generated)
         """
         output_path = self.output_dir / output_file
-        total_qa_pairs = 0
 
         hindi_documents = [d for d in documents if d.get("language") == "hi"]
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            for doc in hindi_documents:
-                # For Hindi, we'll use the content as-is since it's already in Hindi
-                content = doc.get("content", "")
-                title = doc.get("title", "")
-                source_url = doc.get("source_url", "")
-                source_site = doc.get("source_site", "")
-
-                if not content or len(content.split()) < 20:
-                    continue
-
-                sentences = self._split_into_sentences(content)
-
-                # Create Hindi QA pairs
-                for i, sentence in enumerate(sentences[:5]):
-                    qa = {
-                        "question": f"{title} के बारे में क्या कहा गया है?",
-                        "answer": sentence,
-                        "language": "hi",
-                        "source_site": source_site,
-                        "source_url": source_url,
-                        "qa_type": "factual",
-                        "confidence": 0.8,
-                    }
-                    f.write(json.dumps(qa, ensure_ascii=False) + "\n")
-                    total_qa_pairs += 1
+        total_qa_pairs = write_jsonl(output_path, self._iter_hindi_qa(hindi_documents))
 
         logger.info(
             "Generated Hindi-specific QA pairs",
@@ -313,6 +362,42 @@ class QADatasetBuilder:
 
         return str(output_path), total_qa_pairs
 
+    def _iter_hindi_qa(self, hindi_documents: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Generate Hindi QA pairs document by document.
+
+        Args:
+            hindi_documents: Documents in Hindi
+
+        Yields:
+            QA pair dicts
+        """
+        for doc in hindi_documents:
+            # For Hindi, we'll use the content as-is since it's already in Hindi
+            content = doc.get("content", "")
+            title = doc.get("title", "")
+            source_url = doc.get("source_url", "")
+            source_site = doc.get("source_site", "")
+
+            if not _has_min_words(content):
+                continue
+
+            sentences = islice(self._iter_sentences(content), 5)
+
+            # Create Hindi QA pairs; only the answer differs between them
+            template = {
+                "question": f"{title} के बारे में क्या कहा गया है?",
+                "answer": "",
+                "language": "hi",
+                "source_site": source_site,
+                "source_url": source_url,
+                "qa_type": "factual",
+                "confidence": 0.8,
+            }
+            for sentence in sentences:
+                qa = template.copy()
+                qa["answer"] = sentence
+                yield qa
+
     def merge_qa_datasets(
         self,
         qa_files: List[str],
@@ -320,6 +405,9 @@ class QADatasetBuilder:
     ) -> Tuple[str, int]:
         """Merge multiple QA datasets.
 
+        Files are concatenated as-is, so the count is the number of lines
+        (blank lines included).
+
         Args:
             qa_files: List of JSONL file paths
             output_file: Output filename
@@ -330,14 +418,22 @@ class QADatasetBuilder:
         output_path = self.output_dir / output_file
         total_qa_pairs = 0
 
-        with open(output_path, "w", encoding="utf-8") as out_f:
+        # Inputs are already JSONL, so merging is a byte copy. Lines are counted
+        # per chunk with bytes.count rather than iterated in Python.
+        with open(output_path, "wb") as out_f:
             for qa_file in qa_files:
                 try:
-                    with open(qa_file, "r", encoding="utf-8") as in_f:
-                        for line in in_f:
-                            if line.strip():
-                                out_f.write(line)
-                                total_qa_pairs += 1
+                    with open(qa_file, "rb") as in_f:
+                        last_byte = b"\n"
+                        for chunk in iter(lambda: in_f.read(MERGE_CHUNK_BYTES), b""):
+                            out_f.write(chunk)
+                            total_qa_pairs += chunk.count(b"\n")
+                            last_byte = chunk[-1:]
+
+                    # Keep the next file's first pair on its own line
+                    if last_byte != b"\n":
+                        out_f.write(b"\n")
+                        total_qa_pairs += 1
                 except Exception as e:
                     logger.warning(
                         "Error reading QA file",
@@ -1,10 +1,35 @@
 """Training configuration and hyperparameters."""
 
-from dataclasses import dataclass, asdict
+import os
+from dataclasses import dataclass, fields
 from typing import Optional, Dict, Any
 
 from app.config import get_config
 
+# Defaults for the list-valued fields; each instance gets its own list copy
+_DEFAULT_TARGET_MODULES = ("q_proj", "v_proj", "k_proj", "o_proj")
+_DEFAULT_REPORT_TO = ("tensorboard",)
+
+
+def _dataclass_to_dict(instance: Any) -> Dict[str, Any]:
+    """Convert a flat config dataclass to a dictionary.
+
+    Unlike dataclasses.asdict this does not deep-copy every value; the
+    fields are scalars apart from a few string lists, which are copied so
+    the result doesn't alias the config.
+
+    Args:
+        instance: Dataclass instance with no nested dataclass fields
+
+    Returns:
+        Dictionary of field values
+    """
+    result = {}
+    for field in fields(instance):
+        value = getattr(instance, field.name)
+        result[field.name] = list(value) if type(value) is list else value
+    return result
+
 
 @dataclass
 class LoRAConfig:
@@ -21,7 +46,7 @@ class LoRAConfig:
         """Set default target modules if not provided."""
         if self.target_modules is None:
             # For Llama and Mistral models
-            self.target_modules = ["q_proj", "v_proj", "k_proj", "o_proj"]
+            self.target_modules = list(_DEFAULT_TARGET_MODULES)
 
 
 @dataclass
@@ -31,7 +56,7 @@ class BitsAndBytesConfig:
     load_in_4bit: bool = True
     bnb_4bit_quant_type: str = "nf4"
     bnb_4bit_use_double_quant: bool = True
-    bnb_4bit_compute_dtype: str = "float16"
+    bnb_4bit_compute_dtype: str = "bfloat16"
 
 
 @dataclass
@@ -58,6 +83,11 @@ class TrainingArguments:
     log_level: str = "info"
     report_to: list = None
     dataloader_pin_memory: bool = True
+    # Collate batches in worker processes so it overlaps GPU compute; under
+    # torchrun every rank starts its own workers, so split the cores
+    dataloader_num_workers: int = min(
+        8, (os.cpu_count() or 1) // 2 // int(os.environ.get("LOCAL_WORLD_SIZE", 1))
+    )
     remove_unused_columns: bool = False
     seed: int = 42
     bf16: bool = True
@@ -65,15 +95,26 @@ class TrainingArguments:
     push_to_hub: bool = False
     hub_strategy: str = "every_save"
     gradient_checkpointing: bool = True
+    # Batch examples of similar length so dynamic padding adds little
+    # (ignored when data.packing is on: packed rows all have the same length)
+    group_by_length: bool = True
+    # Frozen base weights never get grads; skip DDP's per-step unused scan
+    ddp_find_unused_parameters: bool = False
+    # Fuse pointwise ops around the small LoRA matmuls. "default" mode: CUDA
+    # graphs ("reduce-overhead") would be re-recorded for every new shape that
+    # dynamic padding and group_by_length produce
+    torch_compile: bool = False
+    torch_compile_backend: str = "inductor"
+    torch_compile_mode: str = "default"
 
     def __post_init__(self):
         """Set defaults for mutable fields."""
         if self.report_to is None:
-            self.report_to = ["tensorboard"]
+            self.report_to = list(_DEFAULT_REPORT_TO)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return _dataclass_to_dict(self)
 
 
 @dataclass
@@ -81,7 +122,10 @@ class DataConfig:
     """Data processing configuration."""
 
     max_seq_length: int = 2048
-    preprocessing_num_workers: int = 4
+    # Pack short examples into full max_seq_length sequences
+    packing: bool = True
+    # Leave one core free for the main process
+    preprocessing_num_workers: int = max(1, (os.cpu_count() or 1) - 1)
     cache_dir: Optional[str] = None
     dataset_cache_dir: Optional[str] = None
 
@@ -132,11 +176,13 @@ class TrainingConfig:
             warmup_ratio=config.TRAINING_WARMUP_RATIO,
             weight_decay=config.TRAINING_WEIGHT_DECAY,
             max_grad_norm=config.TRAINING_MAX_GRAD_NORM,
+            torch_compile=config.TRAINING_TORCH_COMPILE,
         )
 
         # Data configuration
         self.data = DataConfig(
             max_seq_length=config.TRAINING_MAX_SEQ_LENGTH,
+            dataset_cache_dir=config.TRAINING_DATASET_CACHE_DIR or None,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -150,10 +196,10 @@ class TrainingConfig:
             "output_dir": self.output_dir,
             "train_dataset_path": self.train_dataset_path,
             "eval_dataset_path": self.eval_dataset_path,
-            "lora": asdict(self.lora),
-            "bnb": asdict(self.bnb),
+            "lora": _dataclass_to_dict(self.lora),
+            "bnb": _dataclass_to_dict(self.bnb),
             "training_args": self.training_args.to_dict(),
-            "data": asdict(self.data),
+            "data": _dataclass_to_dict(self.data),
         }
 
 
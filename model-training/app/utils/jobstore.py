@@ -0,0 +1,221 @@
+"""Redis-backed job state storage shared across service workers."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import orjson
+from redis.asyncio import Redis
+
+from app.config import get_config
+
+
+config = get_config()
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Get the shared async Redis client, creating it on first use.
+
+    Returns:
+        Async Redis client
+    """
+    global _redis
+
+    if _redis is None:
+        _redis = Redis(
+            host=config.REDIS_HOST,
+            port=config.REDIS_PORT,
+            password=config.REDIS_PASSWORD,
+            ssl=config.REDIS_SSL,
+            db=config.REDIS_DB_SESSION,
+        )
+
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared async Redis client."""
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+class JobStore:
+    """Store job state as a Redis hash per job.
+
+    Key format: `model_training:{namespace}:{job_id}`. Each hash field holds
+    one JSON-encoded job attribute, so partial updates only touch the fields
+    that changed. Keys expire after `ttl_seconds`.
+    Every write is announced on the `model_training:{namespace}:updates:{job_id}`
+    pub/sub channel so watchers are woken only when state changes.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: Optional[int] = None,
+        redis_client: Optional[Redis] = None,
+    ):
+        """Initialize job store.
+
+        Args:
+            namespace: Job type (e.g., "eval_job", "training_job")
+            ttl_seconds: Expiry for job keys (defaults to JOB_STATE_TTL_SECONDS)
+            redis_client: Redis client (defaults to the shared client)
+        """
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds or config.JOB_STATE_TTL_SECONDS
+        self._redis = redis_client
+
+    @property
+    def redis(self) -> Redis:
+        """Redis client used by this store."""
+        return self._redis if self._redis is not None else get_redis()
+
+    def _key(self, job_id: str) -> str:
+        """Build the Redis key for a job."""
+        return f"model_training:{self.namespace}:{job_id}"
+
+    def _channel(self, job_id: str) -> str:
+        """Build the pub/sub channel announcing a job's updates."""
+        return f"model_training:{self.namespace}:updates:{job_id}"
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job state.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job state dict, or None if the job does not exist
+        """
+        return self._decode(await self.redis.hgetall(self._key(job_id)))
+
+    async def get_many(self, job_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get state for several jobs in one round trip.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            Job state per ID, in input order (None for missing jobs)
+        """
+        if not job_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(self._key(job_id))
+            results = await pipe.execute()
+
+        return [self._decode(raw) for raw in results]
+
+    async def scan_ids(self) -> AsyncIterator[str]:
+        """Iterate over the IDs of all stored jobs.
+
+        Uses SCAN, so it does not block Redis on large keyspaces; intended
+        for startup housekeeping rather than request paths.
+
+        Yields:
+            Job IDs, in no particular order
+        """
+        prefix = self._key("")
+        # Only hashes are job records; other keys can share the prefix
+        async for key in self.redis.scan_iter(match=self._key("*"), count=500, _type="hash"):
+            if isinstance(key, bytes):
+                key = key.decode("utf-8")
+            yield key[len(prefix):]
+
+    async def set(self, job_id: str, payload: Dict[str, Any]) -> None:
+        """Replace job state.
+
+        Args:
+            job_id: Job ID
+            payload: Complete job state
+        """
+        key = self._key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=self._encode(payload))
+            pipe.expire(key, self.ttl_seconds)
+            pipe.publish(self._channel(job_id), b"1")
+            await pipe.execute()
+
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Update selected job fields.
+
+        Args:
+            job_id: Job ID
+            fields: Fields to overwrite
+        """
+        if not fields:
+            return
+
+        key = self._key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=self._encode(fields))
+            pipe.expire(key, self.ttl_seconds)
+            pipe.publish(self._channel(job_id), b"1")
+            await pipe.execute()
+
+    async def watch(
+        self,
+        job_id: str,
+        keepalive_seconds: float = 15.0,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield job state now and again after every change.
+
+        Notifications that arrive while the consumer is busy are coalesced
+        into a single re-read. Iteration stops when the job disappears.
+
+        Args:
+            job_id: Job ID
+            keepalive_seconds: Yield None after this long without an update
+
+        Yields:
+            Current job state, or None on a keepalive timeout
+        """
+        pubsub = self.redis.pubsub()
+        # Subscribe before the first read so no update can slip in between
+        await pubsub.subscribe(self._channel(job_id))
+
+        try:
+            job = await self.get(job_id)
+            while job is not None:
+                yield job
+
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=keepalive_seconds
+                )
+                while message is None:
+                    yield None
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=keepalive_seconds
+                    )
+
+                # Drain notifications that are already queued
+                while await pubsub.get_message(ignore_subscribe_messages=True, timeout=0):
+                    pass
+
+                job = await self.get(job_id)
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    @staticmethod
+    def _decode(raw: Dict[Any, bytes]) -> Optional[Dict[str, Any]]:
+        """Decode a stored hash back into job state (None if empty)."""
+        if not raw:
+            return None
+
+        return {
+            (field.decode("utf-8") if isinstance(field, bytes) else field): orjson.loads(value)
+            for field, value in raw.items()
+        }
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, bytes]:
+        """JSON-encode each field value for storage in a hash."""
+        return {field: orjson.dumps(value) for field, value in fields.items()}
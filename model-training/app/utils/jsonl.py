@@ -0,0 +1,183 @@
+"""JSONL reading and writing utilities."""
+
+import mmap
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import orjson
+
+# Records serialized per write() call and output file buffer size
+WRITE_BATCH_SIZE = 512
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Item count from which write_jsonl_mapped runs on a process pool, and the
+# items handed to a worker per task
+PARALLEL_ITEM_THRESHOLD = 256
+PARALLEL_CHUNK_SIZE = 32
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """Iterate over the raw lines of a file through a memory map.
+
+    Lines are returned as bytes without a text decode pass, so they can be
+    handed straight to orjson or copied to another file.
+
+    Args:
+        path: File path
+
+    Yields:
+        Lines as bytes, including the trailing newline
+    """
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+
+def iter_sampled_lines(
+    path: str,
+    sample_size: int,
+    rng: Optional[random.Random] = None,
+) -> Iterator[Tuple[int, bytes]]:
+    """Iterate over the first lines of a file plus a random sample of the rest.
+
+    One pass over the memory map records where each line starts; only the
+    selected lines are then read, by seeking to their offsets.
+
+    Args:
+        path: File path
+        sample_size: Number of leading lines, and of randomly sampled lines
+        rng: Random source (default: module-level random)
+
+    Yields:
+        (line_number, line) tuples in file order, line numbers starting at 1
+    """
+    rng = rng or random
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offsets = [0]
+            pos = mm.find(b"\n")
+            while pos != -1 and pos + 1 < len(mm):
+                offsets.append(pos + 1)
+                pos = mm.find(b"\n", pos + 1)
+
+            head_count = min(sample_size, len(offsets))
+            rest = range(head_count, len(offsets))
+            selected = list(range(head_count)) + sorted(rng.sample(rest, min(sample_size, len(rest))))
+
+            for index in selected:
+                mm.seek(offsets[index])
+                yield index + 1, mm.readline()
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Iterate over records of a JSONL file.
+
+    The file is memory-mapped and read as bytes, so nothing beyond the
+    current record is materialized. Blank lines are skipped.
+
+    Args:
+        path: Path to JSONL file
+
+    Yields:
+        Parsed records
+    """
+    for line in iter_lines(path):
+        if line.strip():
+            yield orjson.loads(line)
+
+
+def write_jsonl(path: Union[str, Path], records: Iterable[Any]) -> int:
+    """Write records to a JSONL file in batched binary writes.
+
+    orjson emits UTF-8 bytes directly (non-ASCII text such as Devanagari is
+    not escaped), so there is no str encode pass through a text-mode file.
+
+    Args:
+        path: Output file path
+        records: Records to serialize (dicts or dataclass instances)
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    batch = bytearray()
+
+    with open(path, "wb", buffering=WRITE_BUFFER_BYTES) as f:
+        for record in records:
+            batch += orjson.dumps(record)
+            batch += b"\n"
+            count += 1
+
+            if count % WRITE_BATCH_SIZE == 0:
+                f.write(batch)
+                batch.clear()
+
+        if batch:
+            f.write(batch)
+
+    return count
+
+
+def _serialize_mapped(fn: Callable[[Any], Sequence[Any]], item: Any) -> Tuple[int, bytes]:
+    """Map one item to records and serialize them as JSONL (pool worker).
+
+    Args:
+        fn: Function producing the records for an item
+        item: Input item
+
+    Returns:
+        Tuple of (record_count, JSONL bytes)
+    """
+    records = fn(item)
+    return len(records), b"".join([orjson.dumps(record) + b"\n" for record in records])
+
+
+def write_jsonl_mapped(
+    path: Union[str, Path],
+    items: Sequence[Any],
+    fn: Callable[[Any], Sequence[Any]],
+    max_workers: Optional[int] = None,
+) -> int:
+    """Write the records fn produces for each item, in item order.
+
+    From PARALLEL_ITEM_THRESHOLD items, fn runs on a process pool whose
+    workers also serialize the records; each item's JSONL bytes are written
+    as they arrive, which is cheaper than pickling the records back. fn must
+    be picklable (a module-level function or a method of a picklable object).
+
+    Args:
+        path: Output file path
+        items: Input items
+        fn: Function producing the records for an item
+        max_workers: Worker processes for large inputs (default: CPU count)
+
+    Returns:
+        Number of records written
+    """
+    if len(items) < PARALLEL_ITEM_THRESHOLD:
+        return write_jsonl(path, (record for item in items for record in fn(item)))
+
+    count = 0
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor, \
+            open(path, "wb", buffering=WRITE_BUFFER_BYTES) as f:
+        for record_count, chunk in executor.map(
+            partial(_serialize_mapped, fn),
+            items,
+            chunksize=PARALLEL_CHUNK_SIZE,
+        ):
+            f.write(chunk)
+            count += record_count
+
+    return count
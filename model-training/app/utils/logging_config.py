@@ -1,13 +1,20 @@
 """JSON logging configuration for structured logging."""
 
+import atexit
 import json
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
 import structlog
 
+from app.config import get_config
+
 
 class JSONFormatter(logging.Formatter):
     """Custom formatter that outputs JSON-structured logs."""
@@ -20,6 +27,26 @@ class JSONFormatter(logging.Formatter):
         """
         super().__init__()
         self.service_name = service_name
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted record;
+        # records arrive in bursts, so the strftime result is mostly reused
+        self._cached_second: Tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record creation time as an ISO 8601 UTC string.
+
+        Args:
+            created: Record creation time in epoch seconds
+
+        Returns:
+            Timestamp with microseconds and a trailing Z
+        """
+        second = int(created)
+        cached_second, prefix = self._cached_second
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = (second, prefix)
+
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}Z"
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
@@ -31,38 +58,151 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "service": self.service_name,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
+        # Optional attributes are read from the record's __dict__ directly
+        # rather than probed with hasattr
+        attrs = record.__dict__
+
         # Add request ID if available
-        if hasattr(record, "request_id") and record.request_id:
-            log_data["request_id"] = record.request_id
+        request_id = attrs.get("request_id")
+        if request_id:
+            log_data["request_id"] = request_id
 
         # Add extra fields
-        if hasattr(record, "extra") and isinstance(record.extra, dict):
-            log_data.update(record.extra)
+        extra = attrs.get("extra")
+        if type(extra) is dict:
+            log_data.update(extra)
 
         # Add exception info if present
         if record.exc_info:
             log_data["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, default=str)
+        try:
+            return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which orjson rejects outright
+            return json.dumps(log_data, default=str)
+
+
+class _ServiceFormatter(logging.Formatter):
+    """Format each record with the JSON formatter of the service that logged it."""
+
+    def __init__(self):
+        """Initialize with no registered services."""
+        super().__init__()
+        self.formatters: Dict[str, JSONFormatter] = {}
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record with its service's formatter.
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            Formatted log string
+        """
+        formatter = self.formatters.get(record.name)
+        if formatter is None:
+            return super().format(record)
+        return formatter.format(record)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record as-is instead of formatting it here.
+
+        Records are consumed within this process, so exc_info and args don't
+        need to be flattened for pickling.
+
+        Args:
+            record: The log record to enqueue
+
+        Returns:
+            The same record
+        """
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the current process's log queue.
+
+        Args:
+            record: The log record to enqueue
+        """
+        _log_queue.put_nowait(record)
+
+
+# Log records from every service go through one queue; a single listener
+# thread formats them and writes to stdout, so logging calls only enqueue
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_service_formatter = _ServiceFormatter()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(_service_formatter)
+_listener: Optional[QueueListener] = None
+
+
+def _start_listener() -> None:
+    """Start the log listener thread for this process."""
+    global _listener
+
+    _listener = QueueListener(_log_queue, _stdout_handler)
+    _listener.start()
+
+
+def _restart_listener_in_child() -> None:
+    """Give a forked child its own queue and listener.
+
+    Listener threads don't survive fork, and records the parent had queued
+    but not yet written are the parent's to write.
+    """
+    global _log_queue
+
+    _log_queue = queue.SimpleQueue()
+    _start_listener()
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    if _listener is not None:
+        _listener.stop()
+
+
+os.register_at_fork(after_in_child=_restart_listener_in_child)
+atexit.register(_stop_listener)
 
 
 class StructuredLogger:
     """Wrapper around structlog for consistent logging."""
 
-    def __init__(self, logger: structlog.BoundLogger):
+    def __init__(self, logger: structlog.BoundLogger, stdlib_logger: logging.Logger):
         """Initialize structured logger.
 
         Args:
             logger: The underlying structlog logger
+            stdlib_logger: The standard library logger it writes through
         """
         self.logger = logger
+        self.stdlib_logger = stdlib_logger
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message at this level would be logged.
+
+        Lets hot paths skip building extra dicts for filtered-out messages.
+
+        Args:
+            level: Standard logging level, e.g. logging.DEBUG
+
+        Returns:
+            True if messages at this level are emitted
+        """
+        return self.stdlib_logger.isEnabledFor(level)
 
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs):
         """Log debug message."""
@@ -114,16 +254,19 @@ def setup_json_logging(service_name: str) -> StructuredLogger:
 
     # Setup standard logging handler
     logger = logging.getLogger(service_name)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(get_config().APP_LOG_LEVEL.upper())
 
     # Remove existing handlers
     logger.handlers = []
 
-    # Add JSON formatter to stdout
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter(service_name))
-    logger.addHandler(handler)
+    # Records are written to stdout by the listener thread with this
+    # service's JSON formatter
+    _service_formatter.formatters[service_name] = JSONFormatter(service_name)
+    logger.addHandler(_DeferredQueueHandler(_log_queue))
+
+    if _listener is None:
+        _start_listener()
 
     # Get structlog logger
     struct_logger = structlog.get_logger(service_name)
-    return StructuredLogger(struct_logger)
+    return StructuredLogger(struct_logger, logger)
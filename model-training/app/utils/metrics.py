@@ -1,7 +1,20 @@
 """Metrics utilities for monitoring and evaluation."""
 
-from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
-from typing import Dict, Any
+from functools import lru_cache
+
+from prometheus_client import (
+    Counter,
+    Histogram,
+    Gauge,
+    generate_latest,
+    CONTENT_TYPE_LATEST,
+    disable_created_metrics,
+)
+from typing import Dict, Any, Tuple
+
+# Counters and histograms would otherwise record a creation timestamp per
+# label set and export an extra *_created series for each of them
+disable_created_metrics()
 
 
 # HTTP metrics
@@ -101,6 +114,39 @@ hallucination_rate = Gauge(
 )
 
 
+@lru_cache(maxsize=1024)
+def _http_request_counter(method: str, endpoint: str, status_code: int) -> Counter:
+    """Get the request counter child for a label set (cached).
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint
+        status_code: HTTP status code
+
+    Returns:
+        Labelled counter
+    """
+    return http_requests_total.labels(method, endpoint, status_code)
+
+
+@lru_cache(maxsize=1024)
+def _http_request_histograms(method: str, endpoint: str) -> Tuple[Histogram, Histogram, Histogram]:
+    """Get the duration and size histogram children for a route (cached).
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint
+
+    Returns:
+        Tuple of (duration, request size, response size) histograms
+    """
+    return (
+        http_request_duration_seconds.labels(method, endpoint),
+        http_request_size_bytes.labels(method, endpoint),
+        http_response_size_bytes.labels(method, endpoint),
+    )
+
+
 def record_http_request(
     method: str,
     endpoint: str,
@@ -119,12 +165,14 @@ def record_http_request(
         request_size: Request body size in bytes
         response_size: Response body size in bytes
     """
-    http_requests_total.labels(method=method, endpoint=endpoint, status_code=status_code).inc()
-    http_request_duration_seconds.labels(method=method, endpoint=endpoint).observe(duration_seconds)
+    _http_request_counter(method, endpoint, status_code).inc()
+
+    duration, request_bytes, response_bytes = _http_request_histograms(method, endpoint)
+    duration.observe(duration_seconds)
     if request_size > 0:
-        http_request_size_bytes.labels(method=method, endpoint=endpoint).observe(request_size)
+        request_bytes.observe(request_size)
     if response_size > 0:
-        http_response_size_bytes.labels(method=method, endpoint=endpoint).observe(response_size)
+        response_bytes.observe(response_size)
 
 
 def record_training_job(model: str, job_id: str, status: str):
@@ -193,6 +241,21 @@ def record_evaluation_duration(model: str, duration_seconds: float):
     evaluation_duration_seconds.labels(model=model).observe(duration_seconds)
 
 
+@lru_cache(maxsize=1024)
+def _evaluation_metric_gauge(model: str, version: str, metric_name: str) -> Gauge:
+    """Get the evaluation metric gauge child for a label set (cached).
+
+    Args:
+        model: Model name
+        version: Model version
+        metric_name: Metric name
+
+    Returns:
+        Labelled gauge
+    """
+    return evaluation_metric_value.labels(model, version, metric_name)
+
+
 def record_evaluation_metrics(model: str, version: str, metrics: Dict[str, float]):
     """Record evaluation metrics.
 
@@ -202,7 +265,7 @@ def record_evaluation_metrics(model: str, version: str, metrics: Dict[str, float
         metrics: Dictionary of metric name to value
     """
     for metric_name, value in metrics.items():
-        evaluation_metric_value.labels(model=model, version=version, metric_name=metric_name).set(value)
+        _evaluation_metric_gauge(model, version, metric_name).set(value)
 
 
 def record_qa_pairs_generated(count: int):
@@ -1,12 +1,16 @@
 """Tests for data preparation module."""
 
-import json
+import random
 import tempfile
 from pathlib import Path
 
+import orjson
 import pytest
 
+from app.training import data_preparer
 from app.training.data_preparer import DataPreparer
+from app.utils import jsonl
+from app.utils.jsonl import iter_sampled_lines, write_jsonl
 
 
 @pytest.fixture
@@ -45,12 +49,29 @@ def test_convert_documents_to_instruction_format(sample_documents):
             assert len(lines) > 0
 
             for line in lines:
-                example = json.loads(line)
+                example = orjson.loads(line)
                 assert "instruction" in example
                 assert "input" in example
                 assert "output" in example
 
 
+def test_write_jsonl_mapped_parallel_matches_serial(sample_documents, monkeypatch):
+    """Test process-pool writes produce the same records in item order."""
+    documents = sample_documents * 4
+    extract = data_preparer._extract_instructions_from_document
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        serial_file = Path(tmpdir) / "serial.jsonl"
+        parallel_file = Path(tmpdir) / "parallel.jsonl"
+        serial_count = jsonl.write_jsonl_mapped(serial_file, documents, extract)
+
+        monkeypatch.setattr(jsonl, "PARALLEL_ITEM_THRESHOLD", 1)
+        parallel_count = jsonl.write_jsonl_mapped(parallel_file, documents, extract, max_workers=2)
+
+        assert parallel_count == serial_count > 0
+        assert parallel_file.read_bytes() == serial_file.read_bytes()
+
+
 def test_split_dataset(sample_documents):
     """Test dataset splitting."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -58,14 +79,17 @@ def test_split_dataset(sample_documents):
 
         # Create sample dataset
         dataset_file = Path(tmpdir) / "test_dataset.jsonl"
-        with open(dataset_file, "w", encoding="utf-8") as f:
-            for i in range(100):
-                example = {
+        write_jsonl(
+            dataset_file,
+            (
+                {
                     "instruction": "Test instruction",
                     "input": f"Input {i}",
                     "output": f"Output {i}",
                 }
-                f.write(json.dumps(example) + "\n")
+                for i in range(100)
+            ),
+        )
 
         train_file, eval_file, test_file = preparer.split_dataset(str(dataset_file))
 
@@ -95,13 +119,16 @@ def test_validate_dataset(sample_documents):
 
         # Create valid dataset
         valid_file = Path(tmpdir) / "valid_dataset.jsonl"
-        with open(valid_file, "w", encoding="utf-8") as f:
-            example = {
-                "instruction": "Test",
-                "input": "Input",
-                "output": "Output",
-            }
-            f.write(json.dumps(example) + "\n")
+        write_jsonl(
+            valid_file,
+            [
+                {
+                    "instruction": "Test",
+                    "input": "Input",
+                    "output": "Output",
+                }
+            ],
+        )
 
         # Validate should pass
         assert preparer.validate_dataset(str(valid_file))
@@ -113,3 +140,55 @@ def test_validate_dataset(sample_documents):
 
         # Validate should fail
         assert not preparer.validate_dataset(str(invalid_file))
+
+
+def test_split_dataset_preserves_raw_lines():
+    """Test splitting copies lines verbatim and skips blank lines."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        preparer = DataPreparer(tmpdir)
+
+        dataset_file = Path(tmpdir) / "raw_dataset.jsonl"
+        lines = [orjson.dumps({"input": f"प्रश्न {i}"}).decode() for i in range(10)]
+        dataset_file.write_text("\n".join(lines[:5]) + "\n\n" + "\n".join(lines[5:]), encoding="utf-8")
+
+        train_file, eval_file, test_file = preparer.split_dataset(str(dataset_file))
+
+        written = []
+        for path in (train_file, eval_file, test_file):
+            written.extend(Path(path).read_text(encoding="utf-8").splitlines())
+
+        assert written == lines
+        assert len(Path(train_file).read_text(encoding="utf-8").splitlines()) == 8
+
+
+def test_iter_sampled_lines_reads_head_and_sample():
+    """Test sampled reads return the head plus sorted random lines verbatim."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dataset_file = Path(tmpdir) / "large_dataset.jsonl"
+        lines = [orjson.dumps({"input": f"Input {i}"}).decode() for i in range(100)]
+        dataset_file.write_text("\n".join(lines), encoding="utf-8")
+
+        sampled = list(iter_sampled_lines(str(dataset_file), 10, rng=random.Random(0)))
+        line_numbers = [line_num for line_num, _ in sampled]
+
+        assert len(sampled) == 20
+        assert line_numbers[:10] == list(range(1, 11))
+        assert line_numbers == sorted(set(line_numbers))
+        for line_num, line in sampled:
+            assert line.rstrip(b"\n").decode("utf-8") == lines[line_num - 1]
+
+
+def test_validate_dataset_sampled(sample_documents):
+    """Test sampled validation covers the leading lines."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        preparer = DataPreparer(tmpdir)
+
+        dataset_file = Path(tmpdir) / "sampled_dataset.jsonl"
+        with open(dataset_file, "wb") as f:
+            f.write(b'{"incomplete": "data"}\n')
+            f.writelines(
+                orjson.dumps({"instruction": "Test", "input": f"{i}", "output": "Output"}) + b"\n"
+                for i in range(50)
+            )
+
+        assert not preparer.validate_dataset(str(dataset_file), sample_size=5)
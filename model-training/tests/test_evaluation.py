@@ -1,10 +1,18 @@
 """Tests for evaluation module."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
 
 from app.evaluation.hindi_qa_eval import HindiQAEvaluator
 from app.evaluation.hallucination_detector import HallucinationDetector
 from app.evaluation.benchmark_suite import BenchmarkSuite
+from app.evaluation.metrics_reporter import MetricsReporter
+from app.evaluation import response_quality
+from app.evaluation.response_quality import ResponseQualityEvaluator
+from app.utils.jsonl import iter_jsonl
 
 
 @pytest.fixture
@@ -29,6 +37,9 @@ def test_exact_match(hindi_evaluator):
     pred2 = "The Ministry"
     assert not hindi_evaluator.exact_match(pred2, ref)
 
+    # Punctuation and surrounding whitespace are normalized away
+    assert hindi_evaluator.exact_match("The Ministry - of Culture!", ref)
+
 
 def test_f1_score(hindi_evaluator):
     """Test F1 score calculation."""
@@ -94,3 +105,296 @@ def test_benchmark_suite():
     assert suite.qa_evaluator is not None
     assert suite.hallucination_detector is not None
     assert suite.quality_evaluator is not None
+
+
+def test_batch_hallucinations_matches_sequential(hallucination_detector):
+    """Test threaded batch evaluation aggregates per-sample results."""
+    predictions = [
+        "The Ministry of Culture promotes Indian heritage and traditions.",
+        "Completely unrelated statement about distant galaxies and planets.",
+    ] * 3
+    sources = [["The Ministry of Culture is responsible for promoting Indian heritage and traditions."]] * 6
+
+    expected = [
+        hallucination_detector.detect_hallucinations(p, s)["hallucination_rate"]
+        for p, s in zip(predictions, sources)
+    ]
+    result = hallucination_detector.evaluate_batch_hallucinations(
+        predictions, sources, max_workers=2
+    )
+
+    assert result["sample_count"] == 6
+    assert result["average_hallucination_rate"] == pytest.approx(sum(expected) / len(expected))
+    assert result["max_hallucination_rate"] == max(expected)
+    assert result["min_hallucination_rate"] == min(expected)
+
+
+def test_compare_models():
+    """Test model comparison over nested metrics."""
+    reporter = MetricsReporter()
+    comparison = reporter.compare_models(
+        [
+            {"qa_metrics": {"exact_match": 0.4, "f1": 0.7}},
+            {"qa_metrics": {"exact_match": 0.6, "f1": 0.5}, "overall_quality": 4.0},
+        ],
+        ["base", "finetuned"],
+    )
+
+    assert comparison["metric_comparison"]["exact_match"] == {"base": 0.4, "finetuned": 0.6}
+    assert comparison["metric_comparison"]["bleu"] == {"base": 0.0, "finetuned": 0.0}
+    assert comparison["best_model"]["exact_match"] == "finetuned"
+    assert comparison["best_model"]["f1"] == "base"
+    assert comparison["best_model"]["overall_quality"] == "finetuned"
+
+
+def test_batch_quality_runs_concurrently(monkeypatch):
+    """Test batch judging is bounded by the configured concurrency."""
+    evaluator = ResponseQualityEvaluator(concurrency=2, judge_batch_size=1)
+    in_flight = 0
+    peak = 0
+
+    async def fake_judgment(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return '{"relevance": 4, "correctness": 4, "completeness": 4, "clarity": 4}'
+
+    monkeypatch.setattr(evaluator, "_get_llm_judgment", fake_judgment)
+
+    metrics = asyncio.run(
+        evaluator.evaluate_batch_quality(["q1", "q2", "q3", "q4"], ["r1", "r2", "r3", "r4"])
+    )
+
+    assert peak == 2
+    assert metrics["sample_count"] == 4
+    assert metrics["overall"] == pytest.approx(4.0)
+
+
+def test_quality_judgments_are_cached(monkeypatch):
+    """Test repeated (question, response) pairs skip the LLM call."""
+    evaluator = ResponseQualityEvaluator()
+    calls = 0
+
+    async def fake_judgment(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return '{"relevance": 5, "correctness": 4, "completeness": 3, "clarity": 4}'
+
+    monkeypatch.setattr(evaluator, "_get_llm_judgment", fake_judgment)
+
+    first = asyncio.run(evaluator.evaluate_response_quality("q", "r", "ref"))
+    second = asyncio.run(evaluator.evaluate_response_quality("q", "r", "ref"))
+    asyncio.run(evaluator.evaluate_response_quality("q", "r", "other ref"))
+
+    assert first == second
+    assert calls == 2
+
+
+def test_unparseable_judgment_is_not_cached(monkeypatch):
+    """Test fallback scores from a garbled judge reply are not cached."""
+    evaluator = ResponseQualityEvaluator()
+    replies = [
+        "not json",
+        '{"relevance": 5, "correctness": 5, "completeness": 5, "clarity": 5}',
+    ]
+
+    async def fake_judgment(prompt, *args, **kwargs):
+        return replies.pop(0)
+
+    monkeypatch.setattr(evaluator, "_get_llm_judgment", fake_judgment)
+
+    async def run():
+        return [await evaluator.evaluate_response_quality("q", "r") for _ in range(3)]
+
+    first, second, third = asyncio.run(run())
+
+    assert first == response_quality.DEFAULT_SCORES
+    assert second["overall"] == third["overall"] == pytest.approx(5.0)
+    assert replies == []
+
+
+def test_batch_quality_packs_judgments(monkeypatch):
+    """Test several responses are judged with a single LLM call."""
+    evaluator = ResponseQualityEvaluator(judge_batch_size=3)
+    prompts = []
+
+    async def fake_judgment(prompt, *args, **kwargs):
+        prompts.append(prompt)
+        return '{"results": [' + ", ".join(
+            ['{"relevance": 5, "correctness": 5, "completeness": 5, "clarity": 5}'] * 3
+        ) + "]}"
+
+    monkeypatch.setattr(evaluator, "_get_llm_judgment", fake_judgment)
+
+    metrics = asyncio.run(
+        evaluator.evaluate_batch_quality(["q1", "q2", "q3"], ["r1", "r2", "r3"])
+    )
+
+    assert len(prompts) == 1
+    assert "Item 3" in prompts[0]
+    assert metrics["overall"] == pytest.approx(5.0)
+
+
+def test_batch_quality_deduplicates_items(monkeypatch):
+    """Test identical (question, response, reference) rows are judged once."""
+    evaluator = ResponseQualityEvaluator(cache_size=0, judge_batch_size=1)
+    prompts = []
+
+    async def fake_judgment(prompt, *args, **kwargs):
+        prompts.append(prompt)
+        score = 1 if "I don't know" in prompt else 5
+        return (
+            f'{{"relevance": {score}, "correctness": {score}, '
+            f'"completeness": {score}, "clarity": {score}}}'
+        )
+
+    monkeypatch.setattr(evaluator, "_get_llm_judgment", fake_judgment)
+
+    metrics = asyncio.run(
+        evaluator.evaluate_batch_quality(
+            ["q1", "q1", "q1", "q2"],
+            ["I don't know", "I don't know", "I don't know", "r2"],
+        )
+    )
+
+    assert len(prompts) == 2
+    assert metrics["sample_count"] == 4
+    assert metrics["overall"] == pytest.approx(2.0)
+
+
+def test_parse_judgment_ignores_trailing_braces():
+    """Test judge JSON is extracted even with braces in surrounding text."""
+    evaluator = ResponseQualityEvaluator()
+    judgment = (
+        'Scores: {"relevance": 4, "correctness": 5, "completeness": 3, '
+        '"clarity": 4, "reasoning": "uses {braces} and \\"quotes\\""} '
+        "Note: see {appendix}."
+    )
+
+    metrics, valid = evaluator._parse_judgment(judgment)
+
+    assert valid
+    assert metrics["relevance"] == 4.0
+    assert metrics["correctness"] == 5.0
+    assert metrics["overall"] == pytest.approx(4.0)
+
+
+def test_judge_circuit_breaker_short_circuits(monkeypatch):
+    """Test repeated LLM failures open the breaker and skip further calls."""
+    requests_sent = 0
+
+    def handler(request):
+        nonlocal requests_sent
+        requests_sent += 1
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fake_client():
+        return client
+
+    monkeypatch.setattr(response_quality, "get_http_client", fake_client)
+    evaluator = ResponseQualityEvaluator(cache_size=0)
+
+    async def run():
+        return [
+            await evaluator.evaluate_response_quality(f"q{i}", "r")
+            for i in range(8)
+        ]
+
+    results = asyncio.run(run())
+
+    assert requests_sent == evaluator._breaker.fail_max
+    assert all(r == response_quality.DEFAULT_SCORES for r in results)
+
+
+def test_circuit_breaker_half_open_allows_one_trial(monkeypatch):
+    """Test only one trial call passes after the reset timeout."""
+    now = 0.0
+    monkeypatch.setattr(response_quality.time, "monotonic", lambda: now)
+    breaker = response_quality.CircuitBreaker(fail_max=1, reset_timeout=10.0)
+
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now = 10.0
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    # A failed trial reopens the breaker; a successful one closes it
+    breaker.record_failure()
+    now = 15.0
+    assert not breaker.allow()
+    now = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+
+def test_text_quality_splits_sentences_on_terminal_punctuation():
+    """Test sentence counting handles ?, ! and decimals."""
+    evaluator = ResponseQualityEvaluator()
+    response = "Is the museum open? Yes! It opens at 9.30 am on weekdays."
+
+    metrics = evaluator.evaluate_text_quality(response)
+
+    assert metrics["length"]["sentence_count"] == 3
+    assert metrics["language"]["sentence_count"] == 3
+    assert metrics["length"] == evaluator.evaluate_response_length(response)
+    assert metrics["language"] == evaluator.evaluate_language_quality(response)
+
+
+def test_parse_judgment_validates_scores():
+    """Test out-of-range or missing scores fall back to clamped defaults."""
+    evaluator = ResponseQualityEvaluator()
+
+    valid, valid_ok = evaluator._parse_judgment(
+        '{"relevance": 5, "correctness": 4, "completeness": 3, "clarity": 4}'
+    )
+    invalid, invalid_ok = evaluator._parse_judgment('{"relevance": 9, "correctness": 4, "clarity": 4}')
+
+    assert valid_ok and not invalid_ok
+    assert evaluator._parse_judgment("no json here") == (response_quality.DEFAULT_SCORES, False)
+    assert valid["overall"] == pytest.approx(4.0)
+    assert response_quality._validate_judgment({"relevance": 9}) is not None
+    assert invalid["relevance"] == 5.0
+    assert invalid["completeness"] == 2.5
+
+
+def test_iter_jsonl_skips_blank_lines(tmp_path):
+    """Test JSONL iteration over mapped files, including empty ones."""
+    dataset = tmp_path / "eval.jsonl"
+    dataset.write_bytes('{"input": "क्या"}\n\n{"input": "b"}'.encode("utf-8"))
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+
+    assert list(iter_jsonl(str(dataset))) == [{"input": "क्या"}, {"input": "b"}]
+    assert list(iter_jsonl(str(empty))) == []
+
+
+def test_judge_request_is_deterministic_json(monkeypatch):
+    """Test judge calls use greedy decoding, JSON mode and a small token cap."""
+    payloads = []
+
+    content = '{"relevance": 4, "correctness": 4, "completeness": 4, "clarity": 4}'
+
+    def handler(request):
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fake_client():
+        return client
+
+    monkeypatch.setattr(response_quality, "get_http_client", fake_client)
+    evaluator = ResponseQualityEvaluator(cache_size=0)
+
+    metrics = asyncio.run(evaluator.evaluate_response_quality("q", "r"))
+
+    assert metrics["overall"] == pytest.approx(4.0)
+    assert payloads[0]["temperature"] == 0.0
+    assert payloads[0]["max_tokens"] == response_quality.JUDGE_MAX_TOKENS
+    assert payloads[0]["response_format"] == {"type": "json_object"}
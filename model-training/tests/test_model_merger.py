@@ -0,0 +1,79 @@
+"""Tests for LoRA adapter merging."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+peft = pytest.importorskip("peft")
+tokenizers = pytest.importorskip("tokenizers")
+
+from app.training.model_merger import ModelMerger  # noqa: E402
+
+
+def _save_tiny_model(model_dir: Path, adapter_dir: Path, tokenizer_dir: Path) -> None:
+    """Save a tiny Llama base model, a non-zero LoRA adapter and a tokenizer."""
+    torch.manual_seed(0)
+    config = transformers.LlamaConfig(
+        vocab_size=32,
+        hidden_size=16,
+        intermediate_size=32,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        num_key_value_heads=2,
+    )
+    transformers.LlamaForCausalLM(config).save_pretrained(str(model_dir))
+
+    # init_lora_weights=False gives B a random init, so merging changes the weights
+    lora_config = peft.LoraConfig(
+        r=4,
+        lora_alpha=8,
+        target_modules=["q_proj", "v_proj"],
+        init_lora_weights=False,
+        task_type="CAUSAL_LM",
+    )
+    base_model = transformers.LlamaForCausalLM.from_pretrained(str(model_dir))
+    peft.get_peft_model(base_model, lora_config).save_pretrained(str(adapter_dir))
+
+    vocab = {"[UNK]": 0, **{f"w{i}": i for i in range(1, 32)}}
+    tokenizer = transformers.PreTrainedTokenizerFast(
+        tokenizer_object=tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="[UNK]")),
+        unk_token="[UNK]",
+    )
+    tokenizer.save_pretrained(str(tokenizer_dir))
+
+
+def test_merge_lora_adapter_tiny_model():
+    """Test the adapter is folded into real (non-meta) CPU weights."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp = Path(tmpdir)
+        _save_tiny_model(tmp / "base", tmp / "adapter", tmp / "tokenizer")
+
+        output_dir = ModelMerger().merge_lora_adapter(
+            str(tmp / "base"),
+            str(tmp / "adapter"),
+            str(tmp / "merged"),
+            tokenizer_path=str(tmp / "tokenizer"),
+        )
+
+        merged = transformers.LlamaForCausalLM.from_pretrained(
+            str(Path(output_dir) / "model"), torch_dtype=torch.float32
+        )
+        base = transformers.LlamaForCausalLM.from_pretrained(str(tmp / "base"))
+        expected = peft.PeftModel.from_pretrained(
+            transformers.LlamaForCausalLM.from_pretrained(str(tmp / "base")),
+            str(tmp / "adapter"),
+        ).merge_and_unload()
+
+        assert all(param.device.type == "cpu" for param in merged.parameters())
+        assert (Path(output_dir) / "tokenizer").exists()
+
+        merged_weight = merged.model.layers[0].self_attn.q_proj.weight
+        base_weight = base.model.layers[0].self_attn.q_proj.weight
+        expected_weight = expected.model.layers[0].self_attn.q_proj.weight
+
+        assert not torch.allclose(merged_weight, base_weight, atol=1e-2)
+        # The merge runs in bf16, so allow bf16 rounding against the fp32 merge
+        torch.testing.assert_close(merged_weight, expected_weight, atol=1e-2, rtol=1e-2)
@@ -0,0 +1,59 @@
+"""Tests for QA dataset builder."""
+
+import tempfile
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app.training.qa_dataset_builder import QADatasetBuilder
+
+
+@pytest.fixture
+def hindi_documents():
+    """Provide sample Hindi documents for testing."""
+    return [
+        {
+            "title": "भारतीय संस्कृति मंत्रालय",
+            "content": "भारतीय संस्कृति मंत्रालय भारतीय विरासत को बढ़ावा देता है और उसका संरक्षण करता है. " * 10,
+            "source_url": "https://culture.gov.in/hi/about",
+            "language": "hi",
+        },
+    ]
+
+
+def test_generate_hindi_specific_qa_writes_utf8(hindi_documents):
+    """Test Hindi QA pairs are written as unescaped UTF-8 JSON lines."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        builder = QADatasetBuilder(tmpdir)
+        output_file, total = builder.generate_hindi_specific_qa(hindi_documents)
+
+        raw = Path(output_file).read_bytes()
+        lines = raw.decode("utf-8").splitlines()
+
+        assert total == len(lines) == 5
+        assert "भारतीय".encode("utf-8") in raw
+        assert b"\\u" not in raw
+
+        for line in lines:
+            qa = orjson.loads(line)
+            assert qa["language"] == "hi"
+            assert qa["question"].startswith("भारतीय संस्कृति मंत्रालय")
+
+
+def test_merge_qa_datasets_concatenates_bytes():
+    """Test merging copies files verbatim and terminates unterminated lines."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        builder = QADatasetBuilder(tmpdir)
+
+        first = Path(tmpdir) / "first.jsonl"
+        second = Path(tmpdir) / "second.jsonl"
+        first.write_text('{"question": "प्रश्न 1"}\n{"question": "प्रश्न 2"}', encoding="utf-8")
+        second.write_text('{"question": "प्रश्न 3"}\n', encoding="utf-8")
+
+        output_file, total = builder.merge_qa_datasets([str(first), str(second)])
+
+        assert total == 3
+        assert Path(output_file).read_text(encoding="utf-8") == (
+            '{"question": "प्रश्न 1"}\n{"question": "प्रश्न 2"}\n{"question": "प्रश्न 3"}\n'
+        )
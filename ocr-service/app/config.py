@@ -1,6 +1,8 @@
 """Configuration for OCR Service."""
 
 import os
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -43,6 +45,7 @@ class OCRSettings(BaseSettings):
 
     # Batch processing
     max_batch_size: int = 100
+    max_batch_workers: int = os.cpu_count() or 1  # Files OCR'd concurrently
     batch_timeout_seconds: int = 600
 
     # Model cache directory
@@ -57,8 +60,9 @@ class OCRSettings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> OCRSettings:
-    """Get OCR settings instance."""
+    """Get OCR settings instance (cached, so .env is parsed once)."""
     return OCRSettings()
 
 
@@ -5,7 +5,6 @@ import logging
 import json
 import uuid
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
 
 import structlog
 from fastapi import FastAPI, Request, Response
@@ -16,6 +15,7 @@ from fastapi.responses import JSONResponse
 from app.config import settings
 from app.routers import ocr, batch, health
 from app.utils.metrics import setup_metrics
+from app.utils.timestamps import utc_now_iso
 
 # Configure structured logging
 structlog.configure(
@@ -150,7 +150,7 @@ async def root(request: Request):
         "service": settings.service_name,
         "version": settings.version,
         "status": "operational",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
 
@@ -1,6 +1,9 @@
 """Batch OCR router for processing multiple files."""
 
-from typing import Optional
+from io import BytesIO
+from typing import Any, Callable, Optional
+import asyncio
+import time
 import uuid
 import structlog
 from fastapi import APIRouter, File, Form, Request, UploadFile, HTTPException
@@ -22,6 +25,11 @@ pdf_extractor = PDFExtractor()
 # In-memory batch job tracking (in production, use Redis or database)
 batch_jobs = {}
 
+# File extensions treated as PDF regardless of content type
+_PDF_EXTENSIONS = frozenset({"pdf"})
+
+OCRFunction = Callable[[Any, str, int], dict[str, Any]]
+
 
 class BatchResult(BaseModel):
     """Result for a single file in batch."""
@@ -46,6 +54,173 @@ class BatchResponse(BaseModel):
     total_processing_time_ms: float = Field(..., description="Total processing time")
 
 
+def _auto_ocr(page_image: Any, languages: str, page_number: int) -> dict[str, Any]:
+    """
+    OCR a page with Tesseract, falling back to EasyOCR if it fails.
+
+    Args:
+        page_image: PIL Image
+        languages: Language codes passed to the engine
+        page_number: Page number for reference
+
+    Returns:
+        Engine result dict
+    """
+    try:
+        return tesseract_engine.process(page_image, languages, page_number)
+    except Exception:
+        return easyocr_engine.process(page_image, languages, page_number)
+
+
+def _select_engine(engine: str) -> OCRFunction:
+    """
+    Resolve the OCR function for a batch once, before any file is processed.
+
+    Args:
+        engine: OCR engine to use ("auto" | "tesseract" | "easyocr")
+
+    Returns:
+        Function taking (page_image, languages, page_number)
+    """
+    if engine == "auto":
+        return _auto_ocr
+    if engine == "easyocr":
+        return easyocr_engine.process
+    return tesseract_engine.process
+
+
+def _ocr_file(
+    contents: bytes,
+    filename: str,
+    content_type: Optional[str],
+    languages: str,
+    ocr_fn: OCRFunction,
+) -> tuple[str, float]:
+    """
+    Extract pages from one file and OCR them (blocking).
+
+    Args:
+        contents: File bytes
+        filename: Original filename
+        content_type: Upload content type
+        languages: Language codes passed to the engine
+        ocr_fn: OCR function from _select_engine
+
+    Returns:
+        Tuple of (full text, mean page confidence)
+    """
+    # Determine file type
+    file_extension = filename.rpartition(".")[2].lower()
+    is_pdf = file_extension in _PDF_EXTENSIONS or content_type == "application/pdf"
+
+    # Extract pages
+    if is_pdf:
+        pages_data = pdf_extractor.extract_pages(BytesIO(contents), settings.target_dpi)
+        if not pages_data:
+            raise ValueError("Failed to extract pages from PDF")
+    else:
+        from PIL import Image
+
+        image = Image.open(BytesIO(contents))
+        pages_data = [{"image": image, "page_number": 1}]
+
+    # Perform OCR
+    all_text_parts = []
+    confidences = []
+
+    for page_data in pages_data[: settings.max_pdf_pages]:
+        page_result = ocr_fn(page_data["image"], languages, 1)
+
+        all_text_parts.append(page_result["text"])
+        if page_result.get("confidence"):
+            confidences.append(page_result["confidence"])
+
+    full_text = "\n\n".join(all_text_parts)
+    overall_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    return full_text, overall_confidence
+
+
+async def _process_one(
+    file: UploadFile,
+    languages: str,
+    ocr_fn: OCRFunction,
+    semaphore: asyncio.Semaphore,
+    batch_id: str,
+    request_id: str,
+) -> BatchResult:
+    """
+    Read and OCR one file of a batch on a worker thread.
+
+    The upload is read only after a semaphore slot is acquired, so at most
+    max_batch_workers files are held in memory at once.
+
+    Args:
+        file: Uploaded file
+        languages: Language codes passed to the engine
+        ocr_fn: OCR function from _select_engine
+        semaphore: Limits how many files are processed at once
+        batch_id: Batch ID for logging
+        request_id: Request ID for logging
+
+    Returns:
+        BatchResult for the file; failures are reported, not raised
+    """
+    filename = file.filename
+
+    async with semaphore:
+        contents = await file.read()
+        file_size_mb = len(contents) / (1024 * 1024)
+
+        if file_size_mb > settings.max_image_size_mb:
+            logger.warning(
+                "batch_file_too_large",
+                filename=filename,
+                file_size_mb=file_size_mb,
+                batch_id=batch_id,
+                request_id=request_id,
+            )
+            return BatchResult(
+                filename=filename,
+                status="failed",
+                error=f"File exceeds maximum size of {settings.max_image_size_mb}MB",
+            )
+
+        file_start = time.time()
+
+        try:
+            full_text, overall_confidence = await asyncio.to_thread(
+                _ocr_file, contents, filename, file.content_type, languages, ocr_fn
+            )
+        except Exception as e:
+            logger.error(
+                "batch_file_failed",
+                filename=filename,
+                error=str(e),
+                batch_id=batch_id,
+                request_id=request_id,
+            )
+            return BatchResult(filename=filename, status="failed", error=str(e))
+
+        file_processing_time = (time.time() - file_start) * 1000
+
+    logger.info(
+        "batch_file_processed",
+        filename=filename,
+        confidence=overall_confidence,
+        processing_time_ms=file_processing_time,
+        batch_id=batch_id,
+        request_id=request_id,
+    )
+
+    return BatchResult(
+        filename=filename,
+        status="success",
+        text=full_text,
+        confidence=overall_confidence,
+        processing_time_ms=file_processing_time,
+    )
+
+
 @router.post("", response_model=BatchResponse)
 async def batch_ocr_process(
     request: Request,
@@ -64,9 +239,6 @@ async def batch_ocr_process(
     Returns:
         BatchResponse with results for each file
     """
-    import time
-    from io import BytesIO
-
     request_id = getattr(request.state, "request_id", "unknown")
     batch_id = str(uuid.uuid4())
     start_time = time.time()
@@ -104,116 +276,25 @@ async def batch_ocr_process(
         request_id=request_id,
     )
 
-    results = []
-    successful = 0
-    failed = 0
-
-    for file in files:
-        file_start = time.time()
-
-        try:
-            # Read file
-            contents = await file.read()
-            file_size_mb = len(contents) / (1024 * 1024)
-
-            if file_size_mb > settings.max_image_size_mb:
-                logger.warning(
-                    "batch_file_too_large",
-                    filename=file.filename,
-                    file_size_mb=file_size_mb,
-                    batch_id=batch_id,
-                    request_id=request_id,
-                )
-                results.append(
-                    BatchResult(
-                        filename=file.filename,
-                        status="failed",
-                        error=f"File exceeds maximum size of {settings.max_image_size_mb}MB",
-                    )
-                )
-                failed += 1
-                continue
-
-            # Determine file type
-            file_extension = file.filename.split(".")[-1].lower()
-            is_pdf = file_extension == "pdf" or file.content_type == "application/pdf"
-
-            # Extract pages
-            if is_pdf:
-                pages_data = pdf_extractor.extract_pages(
-                    BytesIO(contents), settings.target_dpi
-                )
-                if not pages_data:
-                    raise ValueError("Failed to extract pages from PDF")
-            else:
-                from PIL import Image
-
-                image = Image.open(BytesIO(contents))
-                pages_data = [{"image": image, "page_number": 1}]
-
-            # Perform OCR
-            all_text_parts = []
-            confidences = []
-
-            for page_data in pages_data[: settings.max_pdf_pages]:
-                page_image = page_data["image"]
-
-                if engine == "auto":
-                    try:
-                        page_result = tesseract_engine.process(
-                            page_image, languages, 1
-                        )
-                    except Exception:
-                        page_result = easyocr_engine.process(page_image, languages, 1)
-                elif engine == "easyocr":
-                    page_result = easyocr_engine.process(page_image, languages, 1)
-                else:
-                    page_result = tesseract_engine.process(page_image, languages, 1)
-
-                all_text_parts.append(page_result["text"])
-                if page_result.get("confidence"):
-                    confidences.append(page_result["confidence"])
-
-            full_text = "\n\n".join(all_text_parts)
-            overall_confidence = (
-                sum(confidences) / len(confidences) if confidences else 0.0
-            )
-            file_processing_time = (time.time() - file_start) * 1000
-
-            results.append(
-                BatchResult(
-                    filename=file.filename,
-                    status="success",
-                    text=full_text,
-                    confidence=overall_confidence,
-                    processing_time_ms=file_processing_time,
-                )
-            )
-            successful += 1
-
-            logger.info(
-                "batch_file_processed",
-                filename=file.filename,
-                confidence=overall_confidence,
-                processing_time_ms=file_processing_time,
-                batch_id=batch_id,
-                request_id=request_id,
+    # OCR releases the GIL inside tesseract/easyocr, so files run on worker
+    # threads; the semaphore keeps at most max_batch_workers read and in flight
+    ocr_fn = _select_engine(engine)
+    semaphore = asyncio.Semaphore(settings.max_batch_workers)
+    results = await asyncio.gather(
+        *(
+            _process_one(
+                file,
+                languages,
+                ocr_fn,
+                semaphore,
+                batch_id,
+                request_id,
             )
-
-        except Exception as e:
-            logger.error(
-                "batch_file_failed",
-                filename=file.filename,
-                error=str(e),
-                batch_id=batch_id,
-                request_id=request_id,
-            )
-            results.append(
-                BatchResult(
-                    filename=file.filename, status="failed", error=str(e)
-                )
-            )
-            failed += 1
+            for file in files
+        )
+    )
+    successful = sum(1 for result in results if result.status == "success")
+    failed = len(results) - successful
 
     total_time_ms = (time.time() - start_time) * 1000
 
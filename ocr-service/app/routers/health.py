@@ -1,13 +1,14 @@
 """Health check router."""
 
 import time
-from datetime import datetime, timezone
 from typing import Optional
 
 import structlog
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
 
+from app.utils.timestamps import utc_now_iso
+
 logger = structlog.get_logger()
 
 # Service startup time
@@ -101,7 +102,7 @@ async def health_check(request: Request) -> HealthResponse:
         overall_status = "degraded"
 
     uptime_seconds = time.time() - _startup_time
-    timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    timestamp = utc_now_iso()
 
     response = HealthResponse(
         status=overall_status,
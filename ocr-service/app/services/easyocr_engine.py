@@ -5,6 +5,7 @@ import easyocr
 from PIL import Image
 import structlog
 import re
+import threading
 
 from app.config import settings
 from app.services.preprocessor import ImagePreprocessor
@@ -19,6 +20,8 @@ class EasyOCREngine:
     def __init__(self):
         """Initialize EasyOCR engine."""
         self.reader = None
+        # Batch requests call process() from several threads at once
+        self._reader_lock = threading.Lock()
         self.preprocessor = ImagePreprocessor(
             enable_deskew=settings.deskew_enabled,
             enable_denoise=settings.denoise_enabled,
@@ -35,13 +38,14 @@ class EasyOCREngine:
         """
         lang_list = self._normalize_languages(languages)
 
-        if self.reader is None:
-            logger.info("easyocr_initializing", languages=lang_list)
-            self.reader = easyocr.Reader(
-                lang_list,
-                gpu=False,  # CPU mode for stability
-                model_storage_directory=settings.model_cache_dir,
-            )
+        with self._reader_lock:
+            if self.reader is None:
+                logger.info("easyocr_initializing", languages=lang_list)
+                self.reader = easyocr.Reader(
+                    lang_list,
+                    gpu=False,  # CPU mode for stability
+                    model_storage_directory=settings.model_cache_dir,
+                )
 
         return self.reader
 
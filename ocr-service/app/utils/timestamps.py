@@ -0,0 +1,18 @@
+"""UTC timestamp helpers."""
+
+import time
+
+
+def utc_now_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string.
+
+    Formatted from time.time() directly rather than through a timezone-aware
+    datetime, so no datetime object or suffix replace is needed per call.
+
+    Returns:
+        Timestamp such as "2026-02-24T10:30:00.123456Z"
+    """
+    now = time.time()
+    second = int(now)
+    microseconds = int((now - second) * 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))}.{microseconds:06d}Z"